@@ -25,7 +25,7 @@ from ingest.feed_packs import load_feed_pack_entries
 from ingest.scheduler import run_scheduler
 from realtime.bus import EventBus
 from realtime.sse import router as sse_router
-from store.db import Database, open_database
+from store.db import Database, close_database, open_database, read_connection
 
 
 def _parse_iso(ts: str) -> datetime:
@@ -139,8 +139,7 @@ async def lifespan(app: FastAPI):
         scheduler_task.cancel()
         with suppress(asyncio.CancelledError):
             await scheduler_task
-        with db.lock:
-            db.conn.close()
+        close_database(db)
 
 
 app = FastAPI(lifespan=lifespan)
@@ -176,13 +175,13 @@ async def security_headers(request: Request, call_next):
     map_tile_url = settings.map_tile_url
     x_embeds_enabled = False
 
-    with db.lock:
-        row = db.conn.execute(
+    with read_connection(db) as conn:
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'map_tile_url' LIMIT 1;"
         ).fetchone()
         if row is not None:
             map_tile_url = str(row["value"])
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'x_embeds_enabled' LIMIT 1;"
         ).fetchone()
         if row is not None and str(row["value"]) == "1":
@@ -245,18 +244,18 @@ def index(request: Request) -> HTMLResponse:
     map_tile_url = settings.map_tile_url
     x_embeds_enabled = False
     x_scan_urls: list[str] = []
-    with db.lock:
-        row = db.conn.execute(
+    with read_connection(db) as conn:
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'map_tile_url' LIMIT 1;"
         ).fetchone()
         if row is not None:
             map_tile_url = str(row["value"])
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'x_embeds_enabled' LIMIT 1;"
         ).fetchone()
         if row is not None and str(row["value"]) == "1":
             x_embeds_enabled = True
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'x_scan_urls' LIMIT 1;"
         ).fetchone()
         if row is not None and row["value"]:
@@ -353,8 +352,8 @@ def _query_incidents(
         """
         params.append(limit)
 
-    with db.lock:
-        rows = db.conn.execute(sql, params).fetchall()
+    with read_connection(db) as conn:
+        rows = conn.execute(sql, params).fetchall()
 
     incidents: list[dict] = []
     for r in rows:
@@ -429,8 +428,8 @@ def api_incidents(
 @app.get("/api/incidents/{incident_id}")
 def api_incident(request: Request, incident_id: str) -> JSONResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        row = db.conn.execute(
+    with read_connection(db) as conn:
+        row = conn.execute(
             """
             SELECT *
             FROM incidents
@@ -446,8 +445,8 @@ def api_incident(request: Request, incident_id: str) -> JSONResponse:
 @app.get("/api/incidents/{incident_id}/items")
 def api_incident_items(request: Request, incident_id: str) -> JSONResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        rows = db.conn.execute(
+    with read_connection(db) as conn:
+        rows = conn.execute(
             """
             SELECT i.*
             FROM incident_items ii
@@ -464,8 +463,8 @@ def api_incident_items(request: Request, incident_id: str) -> JSONResponse:
 @app.get("/api/items")
 def api_items(request: Request, limit: int = 100) -> JSONResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        rows = db.conn.execute(
+    with read_connection(db) as conn:
+        rows = conn.execute(
             """
             SELECT item_id, source_id, title, category, published_at, url
             FROM items
@@ -480,8 +479,8 @@ def api_items(request: Request, limit: int = 100) -> JSONResponse:
 @app.get("/api/sources")
 def api_sources(request: Request) -> JSONResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        rows = db.conn.execute(
+    with read_connection(db) as conn:
+        rows = conn.execute(
             """
             SELECT source_id, name, source_type, url, poll_interval_seconds, enabled,
                    next_fetch_at, last_fetch_at, last_success_at, last_error_at,
@@ -505,8 +504,8 @@ def api_stats(
     since_iso = since_dt.isoformat().replace("+00:00", "Z")
     until_iso = until_dt.isoformat().replace("+00:00", "Z")
 
-    with db.lock:
-        by_category = db.conn.execute(
+    with read_connection(db) as conn:
+        by_category = conn.execute(
             """
             SELECT category, COUNT(*) AS n
             FROM incidents
@@ -546,8 +545,8 @@ class SavedViewUpdate(BaseModel):
 @app.get("/api/saved-views")
 def api_saved_views(request: Request) -> JSONResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        rows = db.conn.execute(
+    with read_connection(db) as conn:
+        rows = conn.execute(
             """
             SELECT view_id, name, config_json, created_at, updated_at
             FROM saved_views
@@ -663,29 +662,29 @@ def api_saved_views_apply(request: Request, view_id: str) -> JSONResponse:
 @app.get("/metrics", response_class=PlainTextResponse)
 def metrics(request: Request) -> PlainTextResponse:
     db: Database = request.app.state.db
-    with db.lock:
+    with read_connection(db) as conn:
         items_total = int(
-            db.conn.execute("SELECT COUNT(*) AS n FROM items;").fetchone()["n"]
+            conn.execute("SELECT COUNT(*) AS n FROM items;").fetchone()["n"]
         )
         incidents_total = int(
-            db.conn.execute("SELECT COUNT(*) AS n FROM incidents;").fetchone()["n"]
+            conn.execute("SELECT COUNT(*) AS n FROM incidents;").fetchone()["n"]
         )
         incidents_active = int(
-            db.conn.execute(
+            conn.execute(
                 "SELECT COUNT(*) AS n FROM incidents WHERE status = 'active';"
             ).fetchone()["n"]
         )
         sources_enabled = int(
-            db.conn.execute(
+            conn.execute(
                 "SELECT COUNT(*) AS n FROM sources WHERE enabled = 1;"
             ).fetchone()["n"]
         )
         sources_failing = int(
-            db.conn.execute(
+            conn.execute(
                 "SELECT COUNT(*) AS n FROM sources WHERE consecutive_failures > 0;"
             ).fetchone()["n"]
         )
-        last_ingest = db.conn.execute(
+        last_ingest = conn.execute(
             "SELECT MAX(last_success_at) AS ts FROM sources;"
         ).fetchone()["ts"]
 
@@ -765,8 +764,8 @@ def partial_incidents(
 @app.get("/partials/incident/{incident_id}", response_class=HTMLResponse)
 def partial_incident_detail(request: Request, incident_id: str) -> HTMLResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        incident = db.conn.execute(
+    with read_connection(db) as conn:
+        incident = conn.execute(
             """
             SELECT *
             FROM incidents
@@ -774,7 +773,7 @@ def partial_incident_detail(request: Request, incident_id: str) -> HTMLResponse:
             """,
             (incident_id,),
         ).fetchone()
-        items = db.conn.execute(
+        items = conn.execute(
             """
             SELECT i.*
             FROM incident_items ii
@@ -808,8 +807,8 @@ def partial_incident_detail(request: Request, incident_id: str) -> HTMLResponse:
 @app.get("/partials/source-health", response_class=HTMLResponse)
 def partial_source_health(request: Request) -> HTMLResponse:
     db: Database = request.app.state.db
-    with db.lock:
-        sources = db.conn.execute(
+    with read_connection(db) as conn:
+        sources = conn.execute(
             """
             SELECT source_id, name, source_type, url, poll_interval_seconds,
                    next_fetch_at, last_success_at, last_error_at, consecutive_failures,
@@ -837,23 +836,23 @@ def partial_settings(request: Request) -> HTMLResponse:
     map_tile_url = settings.map_tile_url
     x_embeds_enabled = False
     x_scan_urls_text = ""
-    with db.lock:
-        row = db.conn.execute(
+    with read_connection(db) as conn:
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'polling_enabled' LIMIT 1;"
         ).fetchone()
         if row is not None and str(row["value"]) == "0":
             polling_enabled = False
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'map_tile_url' LIMIT 1;"
         ).fetchone()
         if row is not None:
             map_tile_url = str(row["value"])
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'x_embeds_enabled' LIMIT 1;"
         ).fetchone()
         if row is not None and str(row["value"]) == "1":
             x_embeds_enabled = True
-        row = db.conn.execute(
+        row = conn.execute(
             "SELECT value FROM app_config WHERE key = 'x_scan_urls' LIMIT 1;"
         ).fetchone()
         if row is not None and row["value"]:
@@ -871,7 +870,7 @@ def partial_settings(request: Request) -> HTMLResponse:
             enabled = False
             if source_ids:
                 placeholders = ",".join("?" for _ in source_ids)
-                row = db.conn.execute(
+                row = conn.execute(
                     f"""
                     SELECT COUNT(*) AS n
                     FROM sources
@@ -999,7 +998,7 @@ def partial_timeline(
     if window == "7d":
         bucket_seconds = 7200
 
-    with db.lock:
+    with read_connection(db) as conn:
         where = ["i.published_at >= ?", "i.published_at <= ?"]
         params: list[object] = [
             since_dt.isoformat().replace("+00:00", "Z"),
@@ -1014,7 +1013,7 @@ def partial_timeline(
             where.append("inc.severity_score >= ?")
             params.append(min_sev)
 
-        rows = db.conn.execute(
+        rows = conn.execute(
             f"""
             SELECT ii.incident_id, i.published_at
             FROM incident_items ii
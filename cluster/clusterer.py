@@ -1,27 +1,31 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import math
 import re
-import sqlite3
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from store.db import Database
+from store.db import Database, hamming_distance_i64
 
 
-_TITLE_WHITESPACE_RE = re.compile(r"\s+")
 _TITLE_PUNCT_RE = re.compile(r"[^\w\s]+", flags=re.UNICODE)
+_TITLE_ASCII_PUNCT_TABLE = {
+    code: " " for code in range(128) if _TITLE_PUNCT_RE.fullmatch(chr(code))
+}
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
-    normalized = title.strip().casefold()
-    normalized = _TITLE_PUNCT_RE.sub(" ", normalized)
-    normalized = _TITLE_WHITESPACE_RE.sub(" ", normalized).strip()
-    return normalized
+    folded = title.casefold()
+    if folded.isascii():
+        return " ".join(folded.translate(_TITLE_ASCII_PUNCT_TABLE).split())
+    return " ".join(_TITLE_PUNCT_RE.sub(" ", folded).split())
 
 
 _TRACKING_PARAM_NAMES = {
@@ -33,8 +37,30 @@ _TRACKING_PARAM_NAMES = {
 }
 
 
+_PLAIN_QUERY_RE = re.compile(
+    r"(?:[\w.~-]*=[\w.~-]*(?:&[\w.~-]*=[\w.~-]*)*)?", flags=re.ASCII
+)
+
+
 def canonicalize_url(url: str) -> str:
     parts = urlsplit(url)
+    if _PLAIN_QUERY_RE.fullmatch(parts.query):
+        kept_pairs: list[str] = []
+        for pair in parts.query.split("&") if parts.query else ():
+            key_lower = pair[: pair.index("=")].casefold()
+            if key_lower.startswith("utm_") or key_lower in _TRACKING_PARAM_NAMES:
+                continue
+            kept_pairs.append(pair)
+        return urlunsplit(
+            (
+                parts.scheme,
+                parts.netloc.casefold(),
+                parts.path,
+                "&".join(kept_pairs),
+                "",
+            )
+        )
+
     kept_params: list[tuple[str, str]] = []
     for key, value in parse_qsl(parts.query, keep_blank_values=True):
         key_lower = key.casefold()
@@ -55,44 +81,85 @@ def canonicalize_url(url: str) -> str:
     )
 
 
+_SIMHASH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def simhash_tokens(text: str, *, max_chars: int | None = None) -> list[str]:
+    if max_chars is not None:
+        text = text[:max_chars]
+    return _SIMHASH_TOKEN_RE.findall(text.casefold())
+
+
 def simhash64(text: str) -> int:
-    tokens = re.findall(r"[a-z0-9]+", text.casefold())
-    if not tokens:
-        return 0
+    return simhash64_tokens(simhash_tokens(text))
 
+
+_SIMHASH_LANE_BITS = 32
+_SIMHASH_LANE_BYTES = _SIMHASH_LANE_BITS // 8
+_SIMHASH_BYTE_LANES = [
+    [
+        sum(
+            1 << (_SIMHASH_LANE_BITS * (8 * (7 - index) + bit))
+            for bit in range(8)
+            if value >> bit & 1
+        )
+        for value in range(256)
+    ]
+    for index in range(8)
+]
+_SIMHASH_HASHER = hashlib.blake2b(digest_size=8)
+_SIMHASH_LANE_ONES = sum(1 << (_SIMHASH_LANE_BITS * bit) for bit in range(64))
+_SIMHASH_LANE_TOP_BITS = _SIMHASH_LANE_ONES << (_SIMHASH_LANE_BITS - 1)
+_SIMHASH_BIT_CHARS = bytes.maketrans(b"\x00\x80", b"01")
+
+
+@functools.lru_cache(maxsize=16384)
+def _simhash_token_lanes(token: str) -> int:
+    hasher = _SIMHASH_HASHER.copy()
+    hasher.update(token.encode("utf-8"))
+    b0, b1, b2, b3, b4, b5, b6, b7 = hasher.digest()
+    l0, l1, l2, l3, l4, l5, l6, l7 = _SIMHASH_BYTE_LANES
+    return l0[b0] + l1[b1] + l2[b2] + l3[b3] + l4[b4] + l5[b5] + l6[b6] + l7[b7]
+
+
+def simhash64_tokens(tokens: Iterable[str]) -> int:
     weights: dict[str, int] = {}
     for token in tokens:
         weights[token] = weights.get(token, 0) + 1
+    if not weights:
+        return 0
 
-    vector = [0] * 64
+    token_lanes = _simhash_token_lanes
+    counts = 0
+    total = 0
     for token, weight in weights.items():
-        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
-        token_hash = int.from_bytes(digest, byteorder="big", signed=False)
-        for bit in range(64):
-            if token_hash & (1 << bit):
-                vector[bit] += weight
-            else:
-                vector[bit] -= weight
+        counts += token_lanes(token) * weight
+        total += weight
 
-    result = 0
-    for bit, value in enumerate(vector):
-        if value > 0:
-            result |= 1 << bit
-    return result & ((1 << 64) - 1)
+    bias = (1 << (_SIMHASH_LANE_BITS - 1)) - 1 - total // 2
+    lanes = (counts + bias * _SIMHASH_LANE_ONES) & _SIMHASH_LANE_TOP_BITS
+    top_bytes = lanes.to_bytes(64 * _SIMHASH_LANE_BYTES, "little")[
+        _SIMHASH_LANE_BYTES - 1 :: _SIMHASH_LANE_BYTES
+    ]
+    return int(top_bytes[::-1].translate(_SIMHASH_BIT_CHARS), 2)
 
 
 def hamming_distance(a: int, b: int) -> int:
     return (a ^ b).bit_count()
 
 
+_SIGN_BIT = 1 << 63
+
+
 def _u64_to_i64(value: int) -> int:
-    if value >= (1 << 63):
-        return value - (1 << 64)
-    return value
+    return (value ^ _SIGN_BIT) - _SIGN_BIT
+
+
+_U64_MASK = (1 << 64) - 1
 
 
 def _i64_to_u64(value: int) -> int:
-    return value & ((1 << 64) - 1)
+    return value & _U64_MASK
 
 
 def _utc_now_iso() -> str:
@@ -142,36 +209,33 @@ def _bbox_from_geojson(geom: dict) -> tuple[float, float, float, float] | None:
     if geom_type is None or coords is None:
         return None
 
-    points: list[tuple[float, float]] = []
-
     if geom_type == "Point":
         lon, lat = coords
-        points.append((float(lon), float(lat)))
-    elif geom_type == "Polygon":
-        for ring in coords:
-            for lon, lat in ring:
-                points.append((float(lon), float(lat)))
+        lon = float(lon)
+        lat = float(lat)
+        return (lon, lat, lon, lat)
+    if geom_type == "Polygon" or geom_type == "MultiLineString":
+        lines = coords
     elif geom_type == "MultiPolygon":
-        for polygon in coords:
-            for ring in polygon:
-                for lon, lat in ring:
-                    points.append((float(lon), float(lat)))
+        lines = [ring for polygon in coords for ring in polygon]
     elif geom_type == "LineString":
-        for lon, lat in coords:
-            points.append((float(lon), float(lat)))
-    elif geom_type == "MultiLineString":
-        for line in coords:
-            for lon, lat in line:
-                points.append((float(lon), float(lat)))
+        lines = [coords]
     else:
         return None
 
-    if not points:
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    for line in lines:
+        for lon, lat in line:
+            lon = float(lon)
+            lat = float(lat)
+            min_lon = min(min_lon, lon)
+            max_lon = max(max_lon, lon)
+            min_lat = min(min_lat, lat)
+            max_lat = max(max_lat, lat)
+
+    if min_lon == math.inf:
         return None
-    min_lon = min(p[0] for p in points)
-    min_lat = min(p[1] for p in points)
-    max_lon = max(p[0] for p in points)
-    max_lat = max(p[1] for p in points)
     return (min_lon, min_lat, max_lon, max_lat)
 
 
@@ -294,8 +358,8 @@ def assign_item_to_incident(db: Database, item_id: str) -> ClusterResult:
             raise ValueError(f"item not found: {item_id}")
 
         category = str(item["category"])
-        item_simhash_u = _i64_to_u64(int(item["simhash"]))
-        bucket = (item_simhash_u >> 48) & 0xFFFF
+        item_simhash_i = int(item["simhash"])
+        bucket = (_i64_to_u64(item_simhash_i) >> 48) & 0xFFFF
         lookback_hours = 24 if category in {"news", "social"} else 48
         cutoff_iso = (
             (datetime.now(tz=UTC) - timedelta(hours=lookback_hours))
@@ -303,29 +367,6 @@ def assign_item_to_incident(db: Database, item_id: str) -> ClusterResult:
             .replace("+00:00", "Z")
         )
 
-        candidates = db.conn.execute(
-            """
-            SELECT incident_id, title, summary, incident_simhash, lat, lon, last_seen_at, location_confidence
-            FROM incidents
-            WHERE category = ?
-              AND last_seen_at >= ?
-              AND ((incident_simhash >> 48) & 65535) = ?
-            ORDER BY last_seen_at DESC
-            LIMIT 200;
-            """,
-            (category, cutoff_iso, bucket),
-        ).fetchall()
-
-        best: sqlite3.Row | None = None
-        best_distance = 10_000
-        for candidate in candidates:
-            dist = hamming_distance(
-                item_simhash_u, _i64_to_u64(int(candidate["incident_simhash"]))
-            )
-            if dist < best_distance:
-                best = candidate
-                best_distance = dist
-
         if category in {"news", "social"}:
             match_dist = 4
             match_dist_loose = 10
@@ -343,6 +384,27 @@ def assign_item_to_incident(db: Database, item_id: str) -> ClusterResult:
             match_dist_loose = 12
             jaccard_min = 0.45
 
+        best = db.conn.execute(
+            """
+            SELECT incident_id, title, summary, distance
+            FROM (
+              SELECT incident_id, title, summary, last_seen_at,
+                     hamming_distance(incident_simhash, ?) AS distance
+              FROM incidents
+              WHERE category = ?
+                AND last_seen_at >= ?
+                AND ((incident_simhash >> 48) & 65535) = ?
+              ORDER BY last_seen_at DESC
+              LIMIT 200
+            )
+            WHERE distance <= ?
+            ORDER BY distance ASC, last_seen_at DESC
+            LIMIT 1;
+            """,
+            (item_simhash_i, category, cutoff_iso, bucket, match_dist_loose),
+        ).fetchone()
+        best_distance = int(best["distance"]) if best is not None else 10_000
+
         matched_incident_id: str | None = None
         if best is not None and best_distance <= match_dist:
             matched_incident_id = str(best["incident_id"])
@@ -627,8 +689,8 @@ def _maybe_merge_incidents(db: Database, incident_id: str) -> None:
         .isoformat()
         .replace("+00:00", "Z")
     )
-    sim_u = _i64_to_u64(int(incident["incident_simhash"]))
-    bucket = (sim_u >> 48) & 0xFFFF
+    sim_i = int(incident["incident_simhash"])
+    bucket = (_i64_to_u64(sim_i) >> 48) & 0xFFFF
 
     others = db.conn.execute(
         """
@@ -656,7 +718,7 @@ def _maybe_merge_incidents(db: Database, incident_id: str) -> None:
             > max_km
         ):
             continue
-        dist = hamming_distance(sim_u, _i64_to_u64(int(other["incident_simhash"])))
+        dist = hamming_distance_i64(sim_i, int(other["incident_simhash"]))
         if dist > max_dist:
             continue
 
@@ -5,11 +5,13 @@ import json
 import re
 from pathlib import Path
 
-from store.db import Database
+from store.db import Database, read_connection
 
 
 _NAME_CLEAN_RE = re.compile(r"[^\w\s]+", flags=re.UNICODE)
 _WS_RE = re.compile(r"\s+")
+_COUNTRY_TOKEN_RE = re.compile(r"[a-z]+")
+_PLACE_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
 def normalize_place_name(name: str) -> str:
@@ -20,7 +22,7 @@ def normalize_place_name(name: str) -> str:
 def match_country_in_text(
     countries: list[tuple[str, str, float, float]], text: str
 ) -> tuple[str, float, float] | None:
-    tokens = re.findall(r"[a-z]+", text.casefold())
+    tokens = _COUNTRY_TOKEN_RE.findall(text.casefold())
     if not tokens:
         return None
     joined = f" {' '.join(tokens)} "
@@ -181,7 +183,7 @@ def match_place_in_text(
     coords_hint: tuple[float, float] | None,
     country_code_hint: str | None,
 ) -> dict | None:
-    tokens = re.findall(r"[a-z0-9]+", text.casefold())
+    tokens = _PLACE_TOKEN_RE.findall(text.casefold())
     if not tokens:
         return None
     tokens = tokens[:80]
@@ -272,8 +274,8 @@ def suggest_places(db: Database, q: str, limit: int = 10) -> list[dict]:
     if not q_norm:
         return []
 
-    with db.lock:
-        rows = db.conn.execute(
+    with read_connection(db) as conn:
+        rows = conn.execute(
             """
             SELECT name, kind, country_code, admin1, lat, lon, importance
             FROM places
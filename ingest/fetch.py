@@ -17,6 +17,24 @@ def cache_control_max_age_seconds(cache_control: str | None) -> int | None:
     return int(match.group(1))
 
 
+def cache_freshness_seconds(headers: httpx.Headers) -> int | None:
+    cache_control = headers.get("Cache-Control")
+    if cache_control is None:
+        return None
+    directives = cache_control.casefold()
+    if "no-store" in directives or "no-cache" in directives:
+        return None
+    max_age = cache_control_max_age_seconds(directives)
+    if max_age is None:
+        return None
+    age = headers.get("Age")
+    if age is not None and age.strip().isdigit():
+        max_age -= int(age)
+    if max_age <= 0:
+        return None
+    return max_age
+
+
 async def fetch(
     client: httpx.AsyncClient,
     *,
@@ -25,7 +43,7 @@ async def fetch(
     etag: str | None,
     last_modified: str | None,
     extra_headers: dict[str, str] | None = None,
-) -> tuple[int, bytes | None, dict[str, str], int]:
+) -> tuple[int, bytes | None, httpx.Headers, int]:
     headers = {
         "User-Agent": user_agent,
         "Accept": "application/json, application/xml, application/rss+xml, text/xml, */*",
@@ -43,6 +61,6 @@ async def fetch(
     return (
         response.status_code,
         (response.content if response.status_code == 200 else None),
-        dict(response.headers),
+        response.headers,
         elapsed_ms,
     )
@@ -7,5 +7,7 @@ def parse_geojson(data: bytes) -> list[dict]:
     doc = json.loads(data)
     if doc.get("type") != "FeatureCollection":
         return []
-    features = doc.get("features", [])
-    return list(features)
+    features = doc.get("features")
+    if isinstance(features, list):
+        return features
+    return []
@@ -4,8 +4,9 @@ import asyncio
 import json
 import os
 import sqlite3
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from urllib.parse import urlencode, urlsplit
@@ -23,7 +24,7 @@ from geo.gazetteer import (
 from geo.coords_extract import extract_coords_centroid
 from geo.airports import load_airports_by_iata
 from health.health import record_fetch_error, record_fetch_success
-from ingest.fetch import cache_control_max_age_seconds, fetch
+from ingest.fetch import cache_freshness_seconds, fetch
 from ingest.feed_packs import load_feed_pack_entries
 from ingest.parsers.geojson import parse_geojson
 from ingest.parsers.govuk import parse_govuk_travel_advice_index
@@ -60,7 +61,7 @@ from normalize.normalize import (
     normalize_usgs_earthquake,
 )
 from realtime.bus import Event, EventBus
-from store.db import Database
+from store.db import Database, index_items_fts, read_connection
 
 
 ParseFn = Callable[[bytes], list[dict]]
@@ -80,10 +81,64 @@ class SourcePlugin:
     default_enabled: bool = True
     headers: dict[str, str] | None = None
     build_url: BuildUrlFn | None = None
+    host: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "host", urlsplit(self.url).netloc)
+
+
+@dataclass(frozen=True)
+class WriteJob:
+    source_id: str
+    items: list[dict]
+    cursor: str | None
+
+
+@dataclass
+class SourceState:
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_MAX_IN_FLIGHT = 12
+_MAX_PER_HOST = 2
+
+_CENTROID_CACHE_SIZE = 1024
+
+ITEM_COLS = (
+    "item_id",
+    "source_id",
+    "source_type",
+    "external_id",
+    "url",
+    "title",
+    "summary",
+    "content",
+    "published_at",
+    "updated_at",
+    "fetched_at",
+    "category",
+    "tags",
+    "geom_geojson",
+    "lat",
+    "lon",
+    "location_name",
+    "location_confidence",
+    "location_rationale",
+    "raw",
+    "hash_title",
+    "hash_content",
+    "simhash",
+)
+_INSERT_ITEM_SQL = (
+    f"INSERT INTO items({', '.join(ITEM_COLS)}) "
+    f"VALUES({', '.join('?' for _ in ITEM_COLS)});"
+)
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
+    return datetime.now(tz=UTC).strftime(_ISO_FMT)
 
 
 def phase1_sources() -> list[SourcePlugin]:
@@ -852,75 +907,74 @@ async def run_scheduler(*, settings: Settings, db: Database, bus: EventBus) -> N
     )
     plugin_by_id = {p.source_id: p for p in plugins}
     ensure_sources(db, plugins)
+    source_state = _load_source_state(db)
 
     global_sem = asyncio.Semaphore(4)
     host_sems: dict[str, asyncio.Semaphore] = {}
     plugins_lock = asyncio.Lock()
     next_cleanup_at = datetime.now(tz=UTC) + timedelta(minutes=10)
-
-    async with httpx.AsyncClient(follow_redirects=True) as client:
+    write_queue: asyncio.Queue[WriteJob] = asyncio.Queue(maxsize=32)
+
+    async with (
+        httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=120.0,
+            ),
+        ) as client,
+        asyncio.TaskGroup() as task_group,
+    ):
+        task_group.create_task(_writer(db, write_queue, bus))
         await _ensure_msi_openapi(client, db, settings.user_agent)
+        in_flight: dict[asyncio.Task[None], str] = {}
         while True:
-            now_iso = _utc_now_iso()
-            polling_enabled = True
-            with db.lock:
-                row = db.conn.execute(
-                    "SELECT value FROM app_config WHERE key = 'polling_enabled' LIMIT 1;"
-                ).fetchone()
-                if row is not None and str(row["value"]) == "0":
-                    polling_enabled = False
-
-            due = []
-            if polling_enabled:
-                with db.lock:
-                    due = db.conn.execute(
-                        """
-                        SELECT source_id, url, etag, last_modified, poll_interval_seconds
-                        FROM sources
-                        WHERE enabled = 1
-                          AND (next_fetch_at IS NULL OR next_fetch_at <= ?)
-                        ORDER BY COALESCE(next_fetch_at, '') ASC
-                        LIMIT 12;
-                        """,
-                        (now_iso,),
-                    ).fetchall()
+            due: list[str] = []
+            if len(in_flight) < _MAX_IN_FLIGHT:
+                due = await asyncio.to_thread(_due_source_ids, db, _utc_now_iso())
+
+            running = set(in_flight.values())
+            for source_id in due:
+                if len(in_flight) >= _MAX_IN_FLIGHT:
+                    break
+                if source_id in running:
+                    continue
+                plugin = plugin_by_id.get(source_id)
+                if plugin is None:
+                    continue
+                host_sem = host_sems.setdefault(
+                    plugin.host, asyncio.Semaphore(_MAX_PER_HOST)
+                )
+                task = task_group.create_task(
+                    _run_one(
+                        client,
+                        plugin,
+                        db,
+                        bus,
+                        write_queue,
+                        plugin_by_id,
+                        plugins_lock,
+                        settings,
+                        global_sem,
+                        host_sem,
+                        source_state.setdefault(source_id, SourceState()),
+                    )
+                )
+                in_flight[task] = source_id
 
-            if not due:
+            if not in_flight:
                 await asyncio.sleep(0.5)
             else:
-                tasks = []
-                for row in due:
-                    source_id = str(row["source_id"])
-                    plugin = plugin_by_id.get(source_id)
-                    if plugin is None:
-                        continue
-                    host = urlsplit(plugin.url).netloc
-                    host_sem = host_sems.setdefault(host, asyncio.Semaphore(1))
-                    tasks.append(
-                        asyncio.create_task(
-                            _run_one(
-                                client,
-                                plugin,
-                                db,
-                                bus,
-                                plugin_by_id,
-                                plugins_lock,
-                                settings,
-                                global_sem,
-                                host_sem,
-                                str(row["etag"]) if row["etag"] is not None else None,
-                                str(row["last_modified"])
-                                if row["last_modified"] is not None
-                                else None,
-                                int(row["poll_interval_seconds"]),
-                            )
-                        )
-                    )
-                if tasks:
-                    await asyncio.gather(*tasks)
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=0.5, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    del in_flight[task]
+                    task.result()
 
             if datetime.now(tz=UTC) >= next_cleanup_at:
-                _run_retention(db, settings)
+                await asyncio.to_thread(_run_retention, db, settings)
                 next_cleanup_at = datetime.now(tz=UTC) + timedelta(hours=1)
 
 
@@ -929,18 +983,21 @@ async def _run_one(
     plugin: SourcePlugin,
     db: Database,
     bus: EventBus,
+    write_queue: asyncio.Queue[WriteJob],
     plugin_by_id: dict[str, SourcePlugin],
     plugins_lock: asyncio.Lock,
     settings: Settings,
     global_sem: asyncio.Semaphore,
     host_sem: asyncio.Semaphore,
-    etag: str | None,
-    last_modified: str | None,
-    poll_interval_seconds: int,
+    state: SourceState,
 ) -> None:
     async with global_sem, host_sem:
         fetched_at = _utc_now_iso()
-        url = plugin.build_url(db, fetched_at) if plugin.build_url else plugin.url
+        url = (
+            await asyncio.to_thread(plugin.build_url, db, fetched_at)
+            if plugin.build_url
+            else plugin.url
+        )
         user_agent = settings.user_agent
         extra_headers = plugin.headers
 
@@ -960,7 +1017,8 @@ async def _run_one(
                     timeout=httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0),
                 )
             except httpx.TimeoutException:
-                backoff = record_fetch_error(
+                backoff = await asyncio.to_thread(
+                    record_fetch_error,
                     db,
                     source_id=plugin.source_id,
                     status_code=None,
@@ -975,7 +1033,8 @@ async def _run_one(
                 )
                 return
             except httpx.RequestError as e:
-                backoff = record_fetch_error(
+                backoff = await asyncio.to_thread(
+                    record_fetch_error,
                     db,
                     source_id=plugin.source_id,
                     status_code=None,
@@ -991,7 +1050,8 @@ async def _run_one(
                 return
 
             if res.status_code != 200:
-                backoff = record_fetch_error(
+                backoff = await asyncio.to_thread(
+                    record_fetch_error,
                     db,
                     source_id=plugin.source_id,
                     status_code=res.status_code,
@@ -1013,7 +1073,8 @@ async def _run_one(
             try:
                 session = res.json()
             except json.JSONDecodeError:
-                backoff = record_fetch_error(
+                backoff = await asyncio.to_thread(
+                    record_fetch_error,
                     db,
                     source_id=plugin.source_id,
                     status_code=res.status_code,
@@ -1043,12 +1104,13 @@ async def _run_one(
                 client,
                 url=url,
                 user_agent=user_agent,
-                etag=etag,
-                last_modified=last_modified,
+                etag=state.etag,
+                last_modified=state.last_modified,
                 extra_headers=extra_headers,
             )
         except httpx.TimeoutException:
-            backoff = record_fetch_error(
+            backoff = await asyncio.to_thread(
+                record_fetch_error,
                 db,
                 source_id=plugin.source_id,
                 status_code=None,
@@ -1063,7 +1125,8 @@ async def _run_one(
             )
             return
         except httpx.RequestError as e:
-            backoff = record_fetch_error(
+            backoff = await asyncio.to_thread(
+                record_fetch_error,
                 db,
                 source_id=plugin.source_id,
                 status_code=None,
@@ -1080,19 +1143,24 @@ async def _run_one(
 
         etag_out = headers.get("ETag")
         last_modified_out = headers.get("Last-Modified")
-        cache_age = cache_control_max_age_seconds(headers.get("Cache-Control"))
-        next_seconds = cache_age if cache_age is not None else poll_interval_seconds
+        fresh_seconds = cache_freshness_seconds(headers)
+        next_seconds = (
+            fresh_seconds if fresh_seconds is not None else plugin.poll_interval_seconds
+        )
 
         if status_code == 304:
-            record_fetch_success(
+            await asyncio.to_thread(
+                record_fetch_success,
                 db,
                 source_id=plugin.source_id,
                 status_code=status_code,
                 fetch_ms=elapsed_ms,
-                etag=etag_out or etag,
-                last_modified=last_modified_out or last_modified,
+                etag=etag_out or state.etag,
+                last_modified=last_modified_out or state.last_modified,
                 next_fetch_in_seconds=next_seconds,
             )
+            state.etag = etag_out or state.etag
+            state.last_modified = last_modified_out or state.last_modified
             await bus.publish(
                 Event(
                     type="source.health",
@@ -1103,7 +1171,8 @@ async def _run_one(
 
         if status_code != 200 or content is None:
             if status_code == 429:
-                backoff = record_fetch_error(
+                backoff = await asyncio.to_thread(
+                    record_fetch_error,
                     db,
                     source_id=plugin.source_id,
                     status_code=status_code,
@@ -1115,16 +1184,11 @@ async def _run_one(
                     retry_seconds = int(retry_after)
                     if retry_seconds > backoff:
                         next_iso = (
-                            (datetime.now(tz=UTC) + timedelta(seconds=retry_seconds))
-                            .isoformat()
-                            .replace("+00:00", "Z")
+                            datetime.now(tz=UTC) + timedelta(seconds=retry_seconds)
+                        ).strftime(_ISO_FMT)
+                        await asyncio.to_thread(
+                            _defer_next_fetch, db, plugin.source_id, next_iso
                         )
-                        with db.lock:
-                            db.conn.execute(
-                                "UPDATE sources SET next_fetch_at = ? WHERE source_id = ?;",
-                                (next_iso, plugin.source_id),
-                            )
-                            db.conn.commit()
                         backoff = retry_seconds
 
                 await bus.publish(
@@ -1139,7 +1203,8 @@ async def _run_one(
                 )
                 return
 
-            backoff = record_fetch_error(
+            backoff = await asyncio.to_thread(
+                record_fetch_error,
                 db,
                 source_id=plugin.source_id,
                 status_code=status_code,
@@ -1161,7 +1226,8 @@ async def _run_one(
         try:
             records = plugin.parse(content)
         except (ValueError, json.JSONDecodeError):
-            backoff = record_fetch_error(
+            backoff = await asyncio.to_thread(
+                record_fetch_error,
                 db,
                 source_id=plugin.source_id,
                 status_code=status_code,
@@ -1226,43 +1292,17 @@ async def _run_one(
                     for added in new_plugins:
                         plugin_by_id[added.source_id] = added
 
-                ensure_sources(db, new_plugins)
-
-                with db.lock:
-                    rows = db.conn.execute(
-                        """
-                        SELECT source_id
-                        FROM sources
-                        WHERE source_id LIKE 'hans_volcano_%';
-                        """
-                    ).fetchall()
-                    existing_ids = {str(r["source_id"]) for r in rows}
-                    to_disable = sorted(existing_ids - current_ids)
-                    if to_disable:
-                        placeholders = ",".join("?" for _ in to_disable)
-                        db.conn.execute(
-                            f"UPDATE sources SET enabled = 0 WHERE source_id IN ({placeholders});",
-                            to_disable,
-                        )
-                    to_enable = sorted(current_ids)
-                    if to_enable:
-                        placeholders = ",".join("?" for _ in to_enable)
-                        db.conn.execute(
-                            f"UPDATE sources SET enabled = 1 WHERE source_id IN ({placeholders});",
-                            to_enable,
-                        )
-                    db.conn.commit()
+                await asyncio.to_thread(
+                    _sync_hans_volcano_sources, db, new_plugins, current_ids
+                )
             else:
-                with db.lock:
-                    db.conn.execute(
-                        "UPDATE sources SET enabled = 0 WHERE source_id LIKE 'hans_volcano_%';"
-                    )
-                    db.conn.commit()
+                await asyncio.to_thread(_sync_hans_volcano_sources, db, [], set())
 
         if plugin.source_id.startswith("tsunami_"):
             next_seconds = 90 if records else 300
 
-        record_fetch_success(
+        await asyncio.to_thread(
+            record_fetch_success,
             db,
             source_id=plugin.source_id,
             status_code=status_code,
@@ -1271,233 +1311,372 @@ async def _run_one(
             last_modified=last_modified_out,
             next_fetch_in_seconds=next_seconds,
         )
+        state.etag = etag_out
+        state.last_modified = last_modified_out
 
-        inserted: list[str] = []
-        title_cutoff = (
-            (datetime.now(tz=UTC) - timedelta(hours=24))
-            .isoformat()
-            .replace("+00:00", "Z")
+        items = await asyncio.to_thread(
+            _normalize_records, plugin.normalize, records, fetched_at
+        )
+        await write_queue.put(
+            WriteJob(
+                source_id=plugin.source_id,
+                items=items,
+                cursor=mastodon_cursor_out,
+            )
         )
 
-        with db.lock:
-            countries: list[tuple[str, str, float, float]] = []
-            country_rows = db.conn.execute(
-                """
-                SELECT name, normalized_name, lat, lon
-                FROM places
-                WHERE kind = 'country' AND lat IS NOT NULL AND lon IS NOT NULL;
-                """
-            ).fetchall()
-            countries = [
-                (
-                    str(r["name"]),
-                    str(r["normalized_name"]),
-                    float(r["lat"]),
-                    float(r["lon"]),
+
+def _due_source_ids(db: Database, now_iso: str) -> list[str]:
+    with read_connection(db) as conn:
+        row = conn.execute(
+            "SELECT value FROM app_config WHERE key = 'polling_enabled' LIMIT 1;"
+        ).fetchone()
+        if row is not None and str(row["value"]) == "0":
+            return []
+        rows = conn.execute(
+            """
+            SELECT source_id
+            FROM sources
+            WHERE enabled = 1
+              AND (next_fetch_at IS NULL OR next_fetch_at <= ?)
+            ORDER BY COALESCE(next_fetch_at, '') ASC
+            LIMIT ?;
+            """,
+            (now_iso, _MAX_IN_FLIGHT),
+        ).fetchall()
+    return [str(r["source_id"]) for r in rows]
+
+
+def _defer_next_fetch(db: Database, source_id: str, next_iso: str) -> None:
+    with db.lock:
+        db.conn.execute(
+            "UPDATE sources SET next_fetch_at = ? WHERE source_id = ?;",
+            (next_iso, source_id),
+        )
+        db.conn.commit()
+
+
+def _sync_hans_volcano_sources(
+    db: Database, new_plugins: list[SourcePlugin], current_ids: set[str]
+) -> None:
+    ensure_sources(db, new_plugins)
+    with db.lock:
+        rows = db.conn.execute(
+            """
+            SELECT source_id
+            FROM sources
+            WHERE source_id LIKE 'hans_volcano_%';
+            """
+        ).fetchall()
+        existing_ids = {str(r["source_id"]) for r in rows}
+        to_disable = sorted(existing_ids - current_ids)
+        if to_disable:
+            placeholders = ",".join("?" for _ in to_disable)
+            db.conn.execute(
+                f"UPDATE sources SET enabled = 0 WHERE source_id IN ({placeholders});",
+                to_disable,
+            )
+        to_enable = sorted(current_ids)
+        if to_enable:
+            placeholders = ",".join("?" for _ in to_enable)
+            db.conn.execute(
+                f"UPDATE sources SET enabled = 1 WHERE source_id IN ({placeholders});",
+                to_enable,
+            )
+        db.conn.commit()
+
+
+def _normalize_records(
+    normalize: NormalizeFn, records: list[dict], fetched_at: str
+) -> list[dict]:
+    return [normalize(record, fetched_at) for record in records]
+
+
+def _load_source_state(db: Database) -> dict[str, SourceState]:
+    with db.lock:
+        rows = db.conn.execute(
+            "SELECT source_id, etag, last_modified FROM sources;"
+        ).fetchall()
+    return {
+        str(r["source_id"]): SourceState(
+            etag=str(r["etag"]) if r["etag"] is not None else None,
+            last_modified=str(r["last_modified"])
+            if r["last_modified"] is not None
+            else None,
+        )
+        for r in rows
+    }
+
+
+async def _writer(db: Database, queue: asyncio.Queue[WriteJob], bus: EventBus) -> None:
+    centroid_cache: OrderedDict[str, tuple[float, float]] = OrderedDict()
+    while True:
+        job = await queue.get()
+        try:
+            inserted = await asyncio.to_thread(
+                _write_items, db, job, centroid_cache=centroid_cache
+            )
+            for item_id in inserted:
+                result: ClusterResult = await asyncio.to_thread(
+                    assign_item_to_incident, db, item_id
                 )
-                for r in country_rows
-            ]
+                await bus.publish(Event(type=result.event_type, data=result.payload))
+        finally:
+            queue.task_done()
 
-            for record in records:
-                item = plugin.normalize(record, fetched_at)
-
-                external_id = str(item.get("external_id") or "").strip() or None
-                item["external_id"] = external_id
-
-                if (
-                    item["category"] in {"news", "social", "maritime_warning"}
-                    and item.get("geom_geojson") is None
-                    and item.get("lat") is None
-                    and item.get("lon") is None
-                ):
-                    text_for_geo = f"{item['title']} {item['summary']} {item.get('content') or ''}".strip()
-                    coords_hint = extract_coords_centroid(text_for_geo)
-                    country_match = (
-                        match_country_in_text(countries, text_for_geo)
-                        if countries
-                        else None
-                    )
-                    country_code_hint = None
-                    if country_match is not None:
-                        country_norm = normalize_place_name(country_match[0])
-                        row = db.conn.execute(
-                            """
-                            SELECT country_code
-                            FROM places
-                            WHERE kind = 'country' AND normalized_name = ?
-                            LIMIT 1;
-                            """,
-                            (country_norm,),
-                        ).fetchone()
-                        if row is not None and row["country_code"]:
-                            country_code_hint = str(row["country_code"])
-
-                    place = match_place_in_text(
-                        db,
-                        text_for_geo,
-                        coords_hint=coords_hint,
-                        country_code_hint=country_code_hint,
-                    )
 
-                    conf = str(item.get("location_confidence") or "U_unknown")
-                    if conf == "U_unknown" or conf.startswith("C_"):
-                        if coords_hint is not None:
-                            item["lat"], item["lon"] = coords_hint
-                            item["location_confidence"] = "B_coords_in_text"
-                            item["location_rationale"] = "Coordinates found in text"
-                            if place is not None and not item.get("location_name"):
-                                item["location_name"] = str(place["name"])
-                        elif place is not None:
-                            item["lat"] = float(place["lat"])
-                            item["lon"] = float(place["lon"])
-                            item["location_name"] = str(place["name"])
-                            item["location_confidence"] = "B_place_match"
-                            item["location_rationale"] = (
-                                f"Gazetteer match: {place['name']}"
-                            )
-                        elif country_match is not None and conf == "U_unknown":
-                            name, lat, lon = country_match
-                            item["location_name"] = name
-                            item["location_confidence"] = "C_country"
-                            item["location_rationale"] = "Country detected in text"
-                            item["lat"] = lat
-                            item["lon"] = lon
-
-                if (
-                    item["source_id"] == "smartraveller_export"
-                    and item.get("location_name")
-                    and item.get("lat") is not None
-                    and item.get("lon") is not None
-                ):
-                    raw = json.loads(str(item["raw"]))
-                    country_code = raw.get("country_code")
-                    normalized_name = normalize_place_name(str(item["location_name"]))
-                    existing = db.conn.execute(
+def _country_centroid(
+    db: Database,
+    centroid_cache: OrderedDict[str, tuple[float, float]],
+    country_norm: str,
+) -> tuple[float, float] | None:
+    centroid = centroid_cache.get(country_norm)
+    if centroid is not None:
+        centroid_cache.move_to_end(country_norm)
+        return centroid
+    centroid = find_country_centroid(db, country_norm)
+    if centroid is not None:
+        centroid_cache[country_norm] = centroid
+        if len(centroid_cache) > _CENTROID_CACHE_SIZE:
+            centroid_cache.popitem(last=False)
+    return centroid
+
+
+def _write_items(
+    db: Database,
+    job: WriteJob,
+    *,
+    centroid_cache: OrderedDict[str, tuple[float, float]] | None = None,
+) -> list[str]:
+    if centroid_cache is None:
+        centroid_cache = OrderedDict()
+    inserted: list[str] = []
+    title_cutoff = (datetime.now(tz=UTC) - timedelta(hours=24)).strftime(_ISO_FMT)
+
+    with db.lock:
+        country_rows = db.conn.execute(
+            """
+            SELECT name, normalized_name, lat, lon
+            FROM places
+            WHERE kind = 'country' AND lat IS NOT NULL AND lon IS NOT NULL;
+            """
+        ).fetchall()
+    countries = [
+        (
+            str(r["name"]),
+            str(r["normalized_name"]),
+            float(r["lat"]),
+            float(r["lon"]),
+        )
+        for r in country_rows
+    ]
+
+    geo_hints: dict[
+        int,
+        tuple[str, tuple[float, float] | None, tuple[str, float, float] | None],
+    ] = {}
+    for index, item in enumerate(job.items):
+        item["external_id"] = str(item.get("external_id") or "").strip() or None
+        if (
+            item["category"] in {"news", "social", "maritime_warning"}
+            and item.get("geom_geojson") is None
+            and item.get("lat") is None
+            and item.get("lon") is None
+        ):
+            text_for_geo = (
+                f"{item['title']} {item['summary']} {item.get('content') or ''}".strip()
+            )
+            geo_hints[index] = (
+                text_for_geo,
+                extract_coords_centroid(text_for_geo),
+                match_country_in_text(countries, text_for_geo) if countries else None,
+            )
+
+    with db.lock:
+        seen_external_ids: set[str] = set()
+        recent_titles: set[str] = set()
+        inserted_rowids: list[int] = []
+        for index, item in enumerate(job.items):
+            external_id = item["external_id"]
+            by_external_id = item["category"] == "news" and external_id is not None
+            if by_external_id:
+                if external_id in seen_external_ids:
+                    continue
+            elif item["hash_title"] in recent_titles:
+                continue
+
+            if index in geo_hints:
+                text_for_geo, coords_hint, country_match = geo_hints[index]
+                country_code_hint = None
+                if country_match is not None:
+                    country_norm = normalize_place_name(country_match[0])
+                    row = db.conn.execute(
                         """
-                        SELECT place_id
+                        SELECT country_code
                         FROM places
                         WHERE kind = 'country' AND normalized_name = ?
                         LIMIT 1;
                         """,
-                        (normalized_name,),
+                        (country_norm,),
                     ).fetchone()
-                    if existing is None:
-                        db.conn.execute(
-                            """
-                            INSERT INTO places(
-                              name, normalized_name, kind, country_code, admin1, lat, lon, importance
-                            )
-                            VALUES(?, ?, 'country', ?, NULL, ?, ?, 0.6);
-                            """,
-                            (
-                                str(item["location_name"]),
-                                normalized_name,
-                                country_code,
-                                float(item["lat"]),
-                                float(item["lon"]),
-                            ),
-                        )
-                    else:
-                        db.conn.execute(
-                            """
-                            UPDATE places
-                            SET name = ?, country_code = COALESCE(?, country_code), lat = ?, lon = ?
-                            WHERE place_id = ?;
-                            """,
-                            (
-                                str(item["location_name"]),
-                                country_code,
-                                float(item["lat"]),
-                                float(item["lon"]),
-                                int(existing["place_id"]),
-                            ),
-                        )
+                    if row is not None and row["country_code"]:
+                        country_code_hint = str(row["country_code"])
 
-                if (
-                    item.get("location_confidence") == "C_country"
-                    and item.get("lat") is None
-                    and item.get("location_name")
-                ):
-                    centroid = find_country_centroid(db, str(item["location_name"]))
-                if centroid is not None:
-                    item["lat"], item["lon"] = centroid
+                place = match_place_in_text(
+                    db,
+                    text_for_geo,
+                    coords_hint=coords_hint,
+                    country_code_hint=country_code_hint,
+                )
 
-                exists = None
-                if item["category"] == "news" and item.get("external_id"):
-                    exists = db.conn.execute(
+                conf = str(item.get("location_confidence") or "U_unknown")
+                if conf == "U_unknown" or conf.startswith("C_"):
+                    if coords_hint is not None:
+                        item["lat"], item["lon"] = coords_hint
+                        item["location_confidence"] = "B_coords_in_text"
+                        item["location_rationale"] = "Coordinates found in text"
+                        if place is not None and not item.get("location_name"):
+                            item["location_name"] = str(place["name"])
+                    elif place is not None:
+                        item["lat"] = float(place["lat"])
+                        item["lon"] = float(place["lon"])
+                        item["location_name"] = str(place["name"])
+                        item["location_confidence"] = "B_place_match"
+                        item["location_rationale"] = f"Gazetteer match: {place['name']}"
+                    elif country_match is not None and conf == "U_unknown":
+                        name, lat, lon = country_match
+                        item["location_name"] = name
+                        item["location_confidence"] = "C_country"
+                        item["location_rationale"] = "Country detected in text"
+                        item["lat"] = lat
+                        item["lon"] = lon
+
+            if (
+                item["source_id"] == "smartraveller_export"
+                and item.get("location_name")
+                and item.get("lat") is not None
+                and item.get("lon") is not None
+            ):
+                country_code = item.get("country_code")
+                normalized_name = normalize_place_name(str(item["location_name"]))
+                existing = db.conn.execute(
+                    """
+                    SELECT place_id
+                    FROM places
+                    WHERE kind = 'country' AND normalized_name = ?
+                    LIMIT 1;
+                    """,
+                    (normalized_name,),
+                ).fetchone()
+                if existing is None:
+                    db.conn.execute(
                         """
-                        SELECT 1
-                        FROM items
-                        WHERE source_id = ?
-                          AND external_id = ?
-                        LIMIT 1;
+                        INSERT INTO places(
+                          name, normalized_name, kind, country_code, admin1, lat, lon, importance
+                        )
+                        VALUES(?, ?, 'country', ?, NULL, ?, ?, 0.6);
                         """,
-                        (item["source_id"], item["external_id"]),
-                    ).fetchone()
+                        (
+                            str(item["location_name"]),
+                            normalized_name,
+                            country_code,
+                            float(item["lat"]),
+                            float(item["lon"]),
+                        ),
+                    )
                 else:
-                    exists = db.conn.execute(
-                        """
-                        SELECT 1
-                        FROM items
-                        WHERE source_id = ?
-                          AND hash_title = ?
-                          AND published_at >= ?
-                        LIMIT 1;
-                        """,
-                        (item["source_id"], item["hash_title"], title_cutoff),
-                    ).fetchone()
-                if exists is not None:
-                    continue
-
-                try:
                     db.conn.execute(
                         """
-                        INSERT INTO items(
-                          item_id, source_id, source_type, external_id, url, title, summary, content,
-                          published_at, updated_at, fetched_at, category, tags,
-                          geom_geojson, lat, lon, location_name, location_confidence, location_rationale,
-                          raw, hash_title, hash_content, simhash
-                        )
-                        VALUES(
-                          :item_id, :source_id, :source_type, :external_id, :url, :title, :summary, :content,
-                          :published_at, :updated_at, :fetched_at, :category, :tags,
-                          :geom_geojson, :lat, :lon, :location_name, :location_confidence, :location_rationale,
-                          :raw, :hash_title, :hash_content, :simhash
-                        );
+                        UPDATE places
+                        SET name = ?, country_code = COALESCE(?, country_code), lat = ?, lon = ?
+                        WHERE place_id = ?;
                         """,
-                        item,
+                        (
+                            str(item["location_name"]),
+                            country_code,
+                            float(item["lat"]),
+                            float(item["lon"]),
+                            int(existing["place_id"]),
+                        ),
                     )
-                except sqlite3.IntegrityError:
-                    continue
-                inserted.append(str(item["item_id"]))
+                centroid_cache.pop(normalized_name, None)
+
+            if (
+                item.get("location_confidence") == "C_country"
+                and item.get("lat") is None
+                and item.get("location_name")
+            ):
+                country_norm = normalize_place_name(str(item["location_name"]))
+                centroid = _country_centroid(db, centroid_cache, country_norm)
+                if centroid is not None:
+                    item["lat"], item["lon"] = centroid
 
-            if mastodon_cursor_out is not None:
-                db.conn.execute(
-                    "UPDATE sources SET cursor = ? WHERE source_id = ?;",
-                    (mastodon_cursor_out, plugin.source_id),
+            exists = None
+            if by_external_id:
+                exists = db.conn.execute(
+                    """
+                    SELECT 1
+                    FROM items
+                    WHERE source_id = ?
+                      AND external_id = ?
+                    LIMIT 1;
+                    """,
+                    (item["source_id"], item["external_id"]),
+                ).fetchone()
+            else:
+                exists = db.conn.execute(
+                    """
+                    SELECT 1
+                    FROM items
+                    WHERE source_id = ?
+                      AND hash_title = ?
+                      AND published_at >= ?
+                    LIMIT 1;
+                    """,
+                    (item["source_id"], item["hash_title"], title_cutoff),
+                ).fetchone()
+            if exists is not None:
+                if by_external_id:
+                    seen_external_ids.add(external_id)
+                else:
+                    recent_titles.add(item["hash_title"])
+                continue
+
+            try:
+                cur = db.conn.execute(
+                    _INSERT_ITEM_SQL, tuple(item[c] for c in ITEM_COLS)
                 )
+            except sqlite3.IntegrityError:
+                continue
+            inserted.append(str(item["item_id"]))
+            inserted_rowids.append(int(cur.lastrowid))
+            if by_external_id:
+                seen_external_ids.add(external_id)
+            elif item["published_at"] >= title_cutoff:
+                recent_titles.add(item["hash_title"])
+
+        if job.cursor is not None:
+            db.conn.execute(
+                "UPDATE sources SET cursor = ? WHERE source_id = ?;",
+                (job.cursor, job.source_id),
+            )
 
-            db.conn.commit()
+        index_items_fts(db, inserted_rowids)
+        db.conn.commit()
 
-        for item_id in inserted:
-            result: ClusterResult = assign_item_to_incident(db, item_id)
-            await bus.publish(Event(type=result.event_type, data=result.payload))
+    return inserted
 
 
 def _run_retention(db: Database, settings: Settings) -> None:
     now = datetime.now(tz=UTC)
-    items_cutoff = (
-        (now - timedelta(days=settings.items_retention_days))
-        .isoformat()
-        .replace("+00:00", "Z")
+    items_cutoff = (now - timedelta(days=settings.items_retention_days)).strftime(
+        _ISO_FMT
     )
     incidents_cutoff = (
-        (now - timedelta(days=settings.incidents_retention_days))
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
-    cooling_cutoff = (now - timedelta(hours=24)).isoformat().replace("+00:00", "Z")
-    resolved_cutoff = (now - timedelta(hours=72)).isoformat().replace("+00:00", "Z")
+        now - timedelta(days=settings.incidents_retention_days)
+    ).strftime(_ISO_FMT)
+    cooling_cutoff = (now - timedelta(hours=24)).strftime(_ISO_FMT)
+    resolved_cutoff = (now - timedelta(hours=72)).strftime(_ISO_FMT)
 
     with db.lock:
         db.conn.execute(
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import functools
 import html
 import hashlib
 import json
+import math
+import os
 import re
-import uuid
+import threading
+import time
 from datetime import UTC, datetime
-
-from cluster.clusterer import canonicalize_url, normalize_title, simhash64
+from itertools import chain
+
+from cluster.clusterer import (
+    canonicalize_url,
+    normalize_title,
+    simhash64_tokens,
+    simhash_tokens,
+)
 from geo.coords_extract import extract_coords_centroid
 
 
@@ -15,56 +25,234 @@ def _utc_now_iso() -> str:
     return datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
 
 
+def _iso_z(dt: datetime) -> str:
+    return dt.isoformat() + "Z"
+
+
 def _iso_from_epoch_ms(ms: int) -> str:
-    return (
-        datetime.fromtimestamp(ms / 1000.0, tz=UTC).isoformat().replace("+00:00", "Z")
+    seconds, millis = divmod(ms, 1000)
+    t = time.gmtime(seconds)
+    base = (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
     )
+    if millis:
+        return f"{base}.{millis:03d}000Z"
+    return f"{base}Z"
+
+
+_SENT_UTC_RE = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2}) ([0-9]{2}):([0-9]{2}):([0-9]{2})"
+)
+
+
+def _parse_sent_utc(value: str) -> datetime:
+    match = _SENT_UTC_RE.fullmatch(value)
+    if match is None:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    return datetime(*map(int, match.groups()))
+
+
+_MSI_ISSUE_DATE_RE = re.compile(
+    r"([0-9]{2})([0-9]{2})([0-9]{2})Z ([A-Za-z]{3}) ([0-9]{4})"
+)
+_MONTHS = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
+
+
+def _parse_msi_issue_date(value: str) -> datetime:
+    match = _MSI_ISSUE_DATE_RE.fullmatch(value)
+    month = _MONTHS.get(match.group(4).upper()) if match is not None else None
+    if month is None:
+        return datetime.strptime(value, "%d%H%MZ %b %Y")
+    day, hour, minute, _, year = match.groups()
+    return datetime(int(year), month, int(day), int(hour), int(minute))
+
+
+_HASHER = hashlib.blake2b(digest_size=8)
+
+
+def _fast_hash_hex(text: str) -> str:
+    hasher = _HASHER.copy()
+    hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+_canonical_url = functools.lru_cache(maxsize=8192)(canonicalize_url)
+
+
+def _clip(text: str, limit: int = 300) -> str:
+    if len(text) <= limit:
+        return text
+    return text[: limit - 3] + "..."
+
+
+_SYNTHETIC_ID_NEEDS_PARSE_RE = re.compile(r"^//|[?#\t\r\n]")
+
+
+def _synthetic_url(scheme: str, ident: str) -> str:
+    url = f"{scheme}:{ident}"
+    if _SYNTHETIC_ID_NEEDS_PARSE_RE.search(ident) is None:
+        return url
+    return _canonical_url(url)
+
+
+_SIMHASH_TEXT_CHARS = 280
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_simhash_tokens(normalized_title: str) -> tuple[str, ...]:
+    return tuple(simhash_tokens(normalized_title))
+
+
+def _item_simhash(normalized_title: str, text: str) -> int:
+    return simhash64_tokens(
+        chain(
+            _title_simhash_tokens(normalized_title),
+            simhash_tokens(text, max_chars=_SIMHASH_TEXT_CHARS),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_hash_state(normalized_title: str) -> tuple[str, hashlib._Hash]:
+    hasher = _HASHER.copy()
+    hasher.update(normalized_title.encode("utf-8"))
+    title_hex = hasher.hexdigest()
+    hasher.update(b"\n")
+    return (title_hex, hasher)
+
+
+def _dual_hash(normalized_title: str, rest: str) -> tuple[str, str]:
+    title_hex, separator_hasher = _title_hash_state(normalized_title)
+    rest = rest.rstrip()
+    if not normalized_title:
+        return (title_hex, _fast_hash_hex(rest.lstrip()))
+    if not rest:
+        return (title_hex, title_hex)
+    content_hasher = separator_hasher.copy()
+    content_hasher.update(rest.encode("utf-8"))
+    return (title_hex, content_hasher.hexdigest())
+
+
+_json_dumps = json.JSONEncoder(ensure_ascii=False, check_circular=False).encode
+
+
+def _tags_json(tags: list[str]) -> str:
+    if not tags:
+        return "[]"
+    for tag in tags:
+        if type(tag) is not str or '"' in tag or "\\" in tag or not tag.isprintable():
+            return _json_dumps(tags)
+    return '["' + '", "'.join(tags) + '"]'
+
+
+@functools.lru_cache(maxsize=1024)
+def _constant_tags_json(*tags: str) -> str:
+    return _tags_json(list(tags))
+
+
+_USGS_TAGS_PREFIX = _tags_json(["usgs", "earthquake"])[:-1]
+_NHC_TAGS_JSON = _tags_json(["nhc", "tropical_cyclone"])
+_SMARTRAVELLER_TAGS_JSON = _tags_json(["smartraveller", "travel_advisory"])
+_HANS_TAGS_JSON = _tags_json(["usgs", "hans", "volcano"])
+_TSUNAMI_TAGS_JSON = _tags_json(["tsunami"])
+_FIRMS_TAGS_JSON = _tags_json(["firms", "wildfire"])
+_FAA_TAGS_JSON = _tags_json(["faa", "aviation_disruption"])
+_GOVUK_TAGS_JSON = _tags_json(["govuk", "travel_advisory"])
+_RELIEFWEB_REPORT_TAGS_JSON = _tags_json(["reliefweb", "report"])
+_RELIEFWEB_DISASTER_TAGS_JSON = _tags_json(["reliefweb", "disaster"])
+_BLUESKY_TAGS_JSON = _tags_json(["bluesky", "social"])
+
+_geometry_json = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(",", ":")
+).encode
+
+
+class _UuidPool:
+    def __init__(self, size: int = 1024) -> None:
+        self._size = size
+        self._ids: list[str] = []
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        h = os.urandom(16 * self._size).hex()
+        self._ids = [
+            f"{h[i : i + 8]}-{h[i + 8 : i + 12]}-4{h[i + 13 : i + 16]}-"
+            f"{'89ab'[int(h[i + 16], 16) & 3]}{h[i + 17 : i + 20]}-{h[i + 20 : i + 32]}"
+            for i in range(0, len(h), 32)
+        ]
+
+    def next(self) -> str:
+        with self._lock:
+            if not self._ids:
+                self._refill()
+            return self._ids.pop()
 
 
-def _sha256_hex(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+_UUID_POOL = _UuidPool()
+
+
+_SIGN_BIT = 1 << 63
 
 
 def _u64_to_i64(value: int) -> int:
-    if value >= (1 << 63):
-        return value - (1 << 64)
-    return value
+    return (value ^ _SIGN_BIT) - _SIGN_BIT
 
 
-def _bbox_from_geojson(geom: dict) -> tuple[float, float, float, float] | None:
+def _centroid_from_geojson(geom: dict) -> tuple[float, float] | None:
     geom_type = geom.get("type")
     coords = geom.get("coordinates")
     if geom_type is None or coords is None:
         return None
 
-    points: list[tuple[float, float]] = []
     if geom_type == "Point":
-        lon, lat = coords
-        points.append((float(lon), float(lat)))
-    elif geom_type == "Polygon":
-        for ring in coords:
-            for lon, lat in ring:
-                points.append((float(lon), float(lat)))
+        lon = float(coords[0])
+        lat = float(coords[1])
+        return (lat, lon)
+    if geom_type == "Polygon":
+        rings = coords
     elif geom_type == "MultiPolygon":
-        for polygon in coords:
-            for ring in polygon:
-                for lon, lat in ring:
-                    points.append((float(lon), float(lat)))
+        rings = [ring for polygon in coords for ring in polygon]
     else:
         return None
 
-    if not points:
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    for ring in rings:
+        for position in ring:
+            lon = float(position[0])
+            lat = float(position[1])
+            min_lon = min(min_lon, lon)
+            max_lon = max(max_lon, lon)
+            min_lat = min(min_lat, lat)
+            max_lat = max(max_lat, lat)
+
+    if min_lon == math.inf:
         return None
-    min_lon = min(p[0] for p in points)
-    min_lat = min(p[1] for p in points)
-    max_lon = max(p[0] for p in points)
-    max_lat = max(p[1] for p in points)
-    return (min_lon, min_lat, max_lon, max_lat)
+    return ((min_lat + max_lat) / 2.0, (min_lon + max_lon) / 2.0)
 
 
-def _centroid_from_bbox(bbox: tuple[float, float, float, float]) -> tuple[float, float]:
-    min_lon, min_lat, max_lon, max_lat = bbox
-    return ((min_lat + max_lat) / 2.0, (min_lon + max_lon) / 2.0)
+def _geometry_fields(geom: object) -> tuple[str | None, float | None, float | None]:
+    if geom is None:
+        return (None, None, None)
+    geom_json = _geometry_json(geom)
+    centroid = _centroid_from_geojson(geom) if isinstance(geom, dict) else None
+    if centroid is None:
+        return (geom_json, None, None)
+    return (geom_json, centroid[0], centroid[1])
 
 
 def normalize_usgs_earthquake(*, source_id: str, record: dict, fetched_at: str) -> dict:
@@ -74,31 +262,38 @@ def normalize_usgs_earthquake(*, source_id: str, record: dict, fetched_at: str)
     lon = float(coords[0])
     lat = float(coords[1])
 
-    title = str(properties.get("title") or "")
-    url = canonicalize_url(str(properties["url"]))
-    published_at = _iso_from_epoch_ms(int(properties["time"]))
-    updated_at = _iso_from_epoch_ms(int(properties["updated"]))
+    usgs_url = properties["url"]
+    time_ms = properties["time"]
+    updated_ms = properties["updated"]
+    place = properties.get("place")
     mag = properties.get("mag")
 
-    summary = str(properties.get("place") or "")
+    title = str(properties.get("title") or "")
+    url = _canonical_url(str(usgs_url))
+    published_at = _iso_from_epoch_ms(int(time_ms))
+    updated_at = (
+        published_at if updated_ms == time_ms else _iso_from_epoch_ms(int(updated_ms))
+    )
+
+    summary = str(place or "")
     raw = {
         "mag": float(mag) if mag is not None else None,
-        "place": properties.get("place"),
-        "time": properties.get("time"),
-        "updated": properties.get("updated"),
-        "usgs_url": properties.get("url"),
+        "place": place,
+        "time": time_ms,
+        "updated": updated_ms,
+        "usgs_url": usgs_url,
     }
 
-    tags: list[str] = ["usgs", "earthquake"]
-    if mag is not None:
-        tags.append(f"mag:{float(mag):.1f}")
+    tags_json = _USGS_TAGS_PREFIX + (
+        f', "mag:{float(mag):.1f}"]' if mag is not None else "]"
+    )
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "geojson_api",
         "external_id": str(record.get("id") or ""),
@@ -110,16 +305,16 @@ def normalize_usgs_earthquake(*, source_id: str, record: dict, fetched_at: str)
         "updated_at": updated_at,
         "fetched_at": fetched_at,
         "category": "earthquake",
-        "tags": json.dumps(tags, ensure_ascii=False),
-        "geom_geojson": json.dumps(geometry, ensure_ascii=False),
+        "tags": tags_json,
+        "geom_geojson": _geometry_json(geometry),
         "lat": lat,
         "lon": lon,
         "location_name": summary or None,
         "location_confidence": "A_exact",
         "location_rationale": "USGS GeoJSON coordinates",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -127,72 +322,68 @@ def normalize_usgs_earthquake(*, source_id: str, record: dict, fetched_at: str)
 def normalize_nws_alert(*, source_id: str, record: dict, fetched_at: str) -> dict:
     properties = record["properties"]
     geometry = record.get("geometry")
-
-    title = str(properties.get("headline") or properties.get("event") or "")
-    url = canonicalize_url(str(record.get("id") or properties.get("id") or ""))
-    external_id = str(record.get("id") or properties.get("id") or url)
-
-    summary = str(properties.get("headline") or properties.get("event") or "")
+    headline = properties.get("headline")
+    event = properties.get("event")
+    severity = properties.get("severity")
+    urgency = properties.get("urgency")
+    certainty = properties.get("certainty")
     description = properties.get("description")
     instruction = properties.get("instruction")
-    content = None
-    if description and instruction:
-        content = f"{description}\n\n{instruction}"
-    elif description:
-        content = str(description)
-    elif instruction:
-        content = str(instruction)
-
-    published_at = str(
-        properties.get("effective")
-        or properties.get("onset")
-        or properties.get("sent")
-        or fetched_at
-    )
-    updated_at = str(
-        properties.get("sent") or properties.get("effective") or fetched_at
+    effective = properties.get("effective")
+    sent = properties.get("sent")
+    onset = properties.get("onset")
+    record_id = record.get("id") or properties.get("id")
+
+    title = str(headline or event or "")
+    url = _canonical_url(str(record_id or ""))
+    external_id = str(record_id or url)
+
+    summary = title
+    content = (
+        "\n\n".join(str(part) for part in (description, instruction) if part) or None
     )
 
+    published_at = str(effective or onset or sent or fetched_at)
+    updated_at = str(sent or effective or fetched_at)
+
     geom_json = None
     lat = None
     lon = None
-    bbox = None
     confidence = "U_unknown"
     rationale = "NWS alert without geometry"
 
     if geometry is not None:
-        geom_json = json.dumps(geometry, ensure_ascii=False)
-        bbox = _bbox_from_geojson(geometry)
-        if bbox is not None:
-            lat, lon = _centroid_from_bbox(bbox)
+        geom_json, lat, lon = _geometry_fields(geometry)
         confidence = "A_exact"
         rationale = "NWS polygon geometry"
 
     raw = {
-        "event": properties.get("event"),
-        "severity": properties.get("severity"),
-        "urgency": properties.get("urgency"),
-        "certainty": properties.get("certainty"),
+        "event": event,
+        "severity": severity,
+        "urgency": urgency,
+        "certainty": certainty,
         "areaDesc": properties.get("areaDesc"),
         "expires": properties.get("expires"),
         "ends": properties.get("ends"),
-        "headline": properties.get("headline"),
+        "headline": headline,
     }
 
     tags = [
         "nws",
         "weather_alert",
-        f"severity:{properties.get('severity')}",
-        f"urgency:{properties.get('urgency')}",
-        f"certainty:{properties.get('certainty')}",
+        f"severity:{severity}",
+        f"urgency:{urgency}",
+        f"certainty:{certainty}",
     ]
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}\n{content or ''}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(
+        normalized_title, f"{summary}\n{content or ''}"
+    )
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "geojson_api",
         "external_id": external_id,
@@ -204,16 +395,16 @@ def normalize_nws_alert(*, source_id: str, record: dict, fetched_at: str) -> dic
         "updated_at": updated_at,
         "fetched_at": fetched_at,
         "category": "weather_alert",
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": str(properties.get("areaDesc") or "") or None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -225,21 +416,14 @@ def normalize_nhc_item(*, source_id: str, record: dict, fetched_at: str) -> dict
     description = str(record.get("description") or "")
 
     geom = record.get("georss")
-    geom_json = json.dumps(geom, ensure_ascii=False) if geom is not None else None
-    lat = None
-    lon = None
-    bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-    if bbox is not None:
-        lat, lon = _centroid_from_bbox(bbox)
+    geom_json, lat, lon = _geometry_fields(geom)
 
     confidence = "A_exact" if geom is not None else "C_source_default"
     rationale = (
         "NHC GIS GeoRSS geometry" if geom is not None else "NHC feed (basin-wide)"
     )
 
-    summary = description.strip()
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(description.strip())
 
     links = record.get("links") or []
     raw = {"links": links}
@@ -247,15 +431,15 @@ def normalize_nhc_item(*, source_id: str, record: dict, fetched_at: str) -> dict
     published_at = str(record.get("published") or fetched_at)
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "xml_api",
         "external_id": external_id,
-        "url": canonicalize_url(url) if url else canonicalize_url(f"nhc:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("nhc", external_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -263,16 +447,16 @@ def normalize_nhc_item(*, source_id: str, record: dict, fetched_at: str) -> dict
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "tropical_cyclone",
-        "tags": json.dumps(["nhc", "tropical_cyclone"], ensure_ascii=False),
+        "tags": _NHC_TAGS_JSON,
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -286,7 +470,7 @@ def normalize_generic_rss(
     tags: list[str] | None = None,
 ) -> dict:
     title = str(record.get("title") or "")
-    url = canonicalize_url(str(record.get("link") or ""))
+    url = _canonical_url(str(record.get("link") or ""))
     external_id = str(record.get("id") or url)
     summary = str(record.get("summary") or "")
     content = record.get("content")
@@ -296,8 +480,10 @@ def normalize_generic_rss(
     raw = {"feed_id": record.get("id")}
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}\n{content or ''}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(
+        normalized_title, f"{summary}\n{content or ''}"
+    )
+    sim = _item_simhash(normalized_title, summary)
 
     tag_values = ["rss", source_id]
     if tags:
@@ -306,7 +492,7 @@ def normalize_generic_rss(
                 tag_values.append(tag)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "rss",
         "external_id": external_id,
@@ -318,45 +504,46 @@ def normalize_generic_rss(
         "updated_at": str(updated_at) if updated_at else None,
         "fetched_at": fetched_at,
         "category": category,
-        "tags": json.dumps(tag_values, ensure_ascii=False),
+        "tags": _tags_json(tag_values),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": None,
         "location_confidence": "U_unknown",
         "location_rationale": "RSS without structured geo",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
 
-_SMARTRAVELLER_TITLE_PREFIX_RE = re.compile(r"^([A-Za-z .()'-]+)\\s*[-:–—]\\s+")
+_SMARTRAVELLER_TITLE_PREFIX_RE = re.compile(r"^([A-Za-z .()'-]+?)\s*[-:–—]\s+")
+_smartraveller_title_prefix = _SMARTRAVELLER_TITLE_PREFIX_RE.match
 
 
 def normalize_smartraveller_rss(
     *, source_id: str, record: dict, fetched_at: str, advice_level: str
 ) -> dict:
     title = str(record.get("title") or "")
-    url = canonicalize_url(str(record.get("link") or ""))
+    url = _canonical_url(str(record.get("link") or ""))
     external_id = str(record.get("id") or url)
     summary = str(record.get("summary") or "")
     published_at = str(record.get("published") or fetched_at)
 
     country = None
-    match = _SMARTRAVELLER_TITLE_PREFIX_RE.match(title)
+    match = _smartraveller_title_prefix(title)
     if match is not None:
         country = match.group(1).strip()
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {"advice_level": advice_level}
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "rss",
         "external_id": external_id,
@@ -368,9 +555,7 @@ def normalize_smartraveller_rss(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "travel_advisory",
-        "tags": json.dumps(
-            ["smartraveller", "travel_advisory", advice_level], ensure_ascii=False
-        ),
+        "tags": _constant_tags_json("smartraveller", "travel_advisory", advice_level),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
@@ -379,9 +564,9 @@ def normalize_smartraveller_rss(
         "location_rationale": "Smartraveller is country-level"
         if country
         else "No country detected",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -397,9 +582,7 @@ def normalize_smartraveller_export(
     )
     url = str(record.get("url") or record.get("link") or "")
 
-    summary = str(record.get("advice") or record.get("summary") or "")
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(str(record.get("advice") or record.get("summary") or ""))
 
     country_code = record.get("iso2") or record.get("countryCode") or record.get("code")
 
@@ -409,19 +592,19 @@ def normalize_smartraveller_export(
     lon_f = float(lon) if lon is not None else None
 
     normalized_title = normalize_title(name)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{name} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {"country_code": country_code}
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": str(country_code or name),
-        "url": canonicalize_url(url)
+        "url": _canonical_url(url)
         if url
-        else canonicalize_url(f"smartraveller:{country_code or name}"),
+        else _synthetic_url("smartraveller", str(country_code or name)),
         "title": name,
         "summary": summary,
         "content": None,
@@ -429,20 +612,46 @@ def normalize_smartraveller_export(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "travel_advisory",
-        "tags": json.dumps(["smartraveller", "travel_advisory"], ensure_ascii=False),
+        "tags": _SMARTRAVELLER_TAGS_JSON,
         "geom_geojson": None,
         "lat": lat_f,
         "lon": lon_f,
         "location_name": name,
         "location_confidence": "C_country",
         "location_rationale": "Smartraveller destinations export",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
+        "country_code": country_code,
     }
 
 
+_GDACS_CAT_RE = re.compile(
+    r"tsunami|volcano|wildfire|forest fire|cyclone|hurricane|typhoon"
+    r"|tropical storm|earthquake|\beq\b"
+)
+_GDACS_CATEGORY_BY_KEYWORD = {
+    "tsunami": "tsunami",
+    "volcano": "volcano",
+    "wildfire": "wildfire",
+    "forest fire": "wildfire",
+    "cyclone": "tropical_cyclone",
+    "hurricane": "tropical_cyclone",
+    "typhoon": "tropical_cyclone",
+    "tropical storm": "tropical_cyclone",
+    "earthquake": "earthquake",
+    "eq": "earthquake",
+}
+_GDACS_CATEGORY_PRIORITY = (
+    "tsunami",
+    "volcano",
+    "wildfire",
+    "tropical_cyclone",
+    "earthquake",
+)
+
+
 def normalize_gdacs_rss(*, source_id: str, record: dict, fetched_at: str) -> dict:
     title = str(record.get("title") or "")
     url = str(record.get("link") or "")
@@ -451,53 +660,36 @@ def normalize_gdacs_rss(*, source_id: str, record: dict, fetched_at: str) -> dic
     published_at = str(record.get("published") or fetched_at)
     updated_at = record.get("updated")
 
-    text = f"{title} {summary}".casefold()
-    if "tsunami" in text:
-        category = "tsunami"
-    elif "volcano" in text:
-        category = "volcano"
-    elif "wildfire" in text or "forest fire" in text:
-        category = "wildfire"
-    elif (
-        "cyclone" in text
-        or "hurricane" in text
-        or "typhoon" in text
-        or "tropical storm" in text
-    ):
-        category = "tropical_cyclone"
-    elif "earthquake" in text or re.search(r"\beq\b", text):
-        category = "earthquake"
-    else:
-        category = "disaster"
+    found = {
+        _GDACS_CATEGORY_BY_KEYWORD[keyword]
+        for keyword in _GDACS_CAT_RE.findall((title + " " + summary).lower())
+    }
+    category = "disaster"
+    for candidate in _GDACS_CATEGORY_PRIORITY:
+        if candidate in found:
+            category = candidate
+            break
 
     geom = record.get("georss")
-    geom_json = json.dumps(geom, ensure_ascii=False) if geom is not None else None
-    lat = None
-    lon = None
-    bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-    if bbox is not None:
-        lat, lon = _centroid_from_bbox(bbox)
+    geom_json, lat, lon = _geometry_fields(geom)
 
     confidence = "A_exact" if geom is not None else "U_unknown"
     rationale = (
         "GDACS GeoRSS geometry" if geom is not None else "GDACS entry without geometry"
     )
 
-    tags = ["gdacs", category]
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {"feed_id": record.get("id")}
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "rss",
         "external_id": external_id,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"gdacs:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("gdacs", external_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -505,16 +697,16 @@ def normalize_gdacs_rss(*, source_id: str, record: dict, fetched_at: str) -> dic
         "updated_at": str(updated_at) if updated_at else None,
         "fetched_at": fetched_at,
         "category": category,
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _constant_tags_json("gdacs", category),
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -529,7 +721,7 @@ def normalize_eonet_event(*, source_id: str, record: dict, fetched_at: str) -> d
     if categories:
         category_title = str(categories[0].get("title") or "")
 
-    cat_text = category_title.casefold()
+    cat_text = category_title.lower()
     if "wildfire" in cat_text:
         category = "wildfire"
     elif "volcano" in cat_text:
@@ -553,10 +745,7 @@ def normalize_eonet_event(*, source_id: str, record: dict, fetched_at: str) -> d
         last = geometries[-1]
         updated_at = str(last.get("date") or published_at)
         geom = {"type": last.get("type"), "coordinates": last.get("coordinates")}
-        geom_json = json.dumps(geom, ensure_ascii=False)
-        bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-        if bbox is not None:
-            lat, lon = _centroid_from_bbox(bbox)
+        geom_json, lat, lon = _geometry_fields(geom)
 
     summary = category_title.strip() or "EONET event"
     raw = {
@@ -565,17 +754,16 @@ def normalize_eonet_event(*, source_id: str, record: dict, fetched_at: str) -> d
         "geometry_count": len(geometries),
     }
 
-    tags = ["eonet", category]
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": event_id,
-        "url": canonicalize_url(url) if url else canonicalize_url(f"eonet:{event_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("eonet", event_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -583,7 +771,7 @@ def normalize_eonet_event(*, source_id: str, record: dict, fetched_at: str) -> d
         "updated_at": updated_at,
         "fetched_at": fetched_at,
         "category": category,
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _constant_tags_json("eonet", category),
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
@@ -594,13 +782,17 @@ def normalize_eonet_event(*, source_id: str, record: dict, fetched_at: str) -> d
         "location_rationale": "EONET geometry"
         if lat is not None and lon is not None
         else "EONET without geometry",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
 
+_HANS_ALERT_RANK = {"normal": 1, "advisory": 2, "watch": 3, "warning": 4}
+_HANS_COLOR_RANK = {"green": 1, "yellow": 2, "orange": 3, "red": 4}
+
+
 def normalize_hans_elevated_notice(
     *, source_id: str, record: dict, fetched_at: str
 ) -> dict:
@@ -614,19 +806,13 @@ def normalize_hans_elevated_notice(
     sent_utc = record.get("sent_utc")
     if sent_utc:
         try:
-            dt = datetime.strptime(str(sent_utc), "%Y-%m-%d %H:%M:%S").replace(
-                tzinfo=UTC
-            )
-            published_at = dt.isoformat().replace("+00:00", "Z")
+            dt = _parse_sent_utc(str(sent_utc))
+            published_at = _iso_z(dt)
         except ValueError:
             published_at = fetched_at
 
-    alert_rank = {"normal": 1, "advisory": 2, "watch": 3, "warning": 4}.get(
-        alert_level.casefold(), 2
-    )
-    color_rank = {"green": 1, "yellow": 2, "orange": 3, "red": 4}.get(
-        color_code.casefold(), 2
-    )
+    alert_rank = _HANS_ALERT_RANK.get(alert_level.casefold(), 2)
+    color_rank = _HANS_COLOR_RANK.get(color_code.casefold(), 2)
     severity_level = max(alert_rank, color_rank)
     if alert_rank >= 4 and color_rank >= 4:
         severity_level = 5
@@ -635,8 +821,8 @@ def normalize_hans_elevated_notice(
     summary = str(record.get("obs_fullname") or "") or "USGS HANS elevated volcano"
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {
         "vnum": record.get("vnum"),
@@ -656,11 +842,11 @@ def normalize_hans_elevated_notice(
     ]
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": notice_id,
-        "url": canonicalize_url(url) if url else canonicalize_url(f"hans:{notice_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("hans", notice_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -668,16 +854,16 @@ def normalize_hans_elevated_notice(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "volcano",
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": volcano_name or None,
         "location_confidence": "U_unknown",
         "location_rationale": "USGS HANS elevated list",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -696,38 +882,29 @@ def normalize_hans_volcano_rss_item(
     description = str(record.get("description") or "")
 
     geom = record.get("georss")
-    geom_json = json.dumps(geom, ensure_ascii=False) if geom is not None else None
-    lat = None
-    lon = None
-    bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-    if bbox is not None:
-        lat, lon = _centroid_from_bbox(bbox)
+    geom_json, lat, lon = _geometry_fields(geom)
 
     confidence = "A_exact" if geom is not None else "U_unknown"
     rationale = (
         "USGS HANS GeoRSS geometry" if geom is not None else "HANS RSS without geo"
     )
 
-    summary = description.strip()
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(description.strip())
 
     published_at = str(record.get("published") or fetched_at)
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {"vnum": vnum, "volcano_name": volcano_name, "links": record.get("links")}
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "xml_api",
         "external_id": external_id,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"hans:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("hans", external_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -735,16 +912,16 @@ def normalize_hans_volcano_rss_item(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "volcano",
-        "tags": json.dumps(["usgs", "hans", "volcano"], ensure_ascii=False),
+        "tags": _HANS_TAGS_JSON,
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": volcano_name or None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -758,12 +935,7 @@ def normalize_tsunami_atom(*, source_id: str, record: dict, fetched_at: str) ->
     updated_at = record.get("updated")
 
     geom = record.get("georss")
-    geom_json = json.dumps(geom, ensure_ascii=False) if geom is not None else None
-    lat = None
-    lon = None
-    bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-    if bbox is not None:
-        lat, lon = _centroid_from_bbox(bbox)
+    geom_json, lat, lon = _geometry_fields(geom)
 
     confidence = "A_exact" if geom is not None else "U_unknown"
     rationale = (
@@ -780,17 +952,15 @@ def normalize_tsunami_atom(*, source_id: str, record: dict, fetched_at: str) ->
         rationale = "PTWC feed default region centroid"
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "xml_api",
         "external_id": external_id,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"tsunami:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("tsunami", external_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -798,16 +968,16 @@ def normalize_tsunami_atom(*, source_id: str, record: dict, fetched_at: str) ->
         "updated_at": str(updated_at) if updated_at else None,
         "fetched_at": fetched_at,
         "category": "tsunami",
-        "tags": json.dumps(["tsunami"], ensure_ascii=False),
+        "tags": _TSUNAMI_TAGS_JSON,
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps({"feed_id": record.get("id")}, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps({"feed_id": record.get("id")}),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -821,12 +991,7 @@ def normalize_tsunami_cap(*, source_id: str, record: dict, fetched_at: str) -> d
     area_desc = str(record.get("area_desc") or "") or None
 
     geom = record.get("geom")
-    geom_json = json.dumps(geom, ensure_ascii=False) if geom is not None else None
-    lat = None
-    lon = None
-    bbox = _bbox_from_geojson(geom) if isinstance(geom, dict) else None
-    if bbox is not None:
-        lat, lon = _centroid_from_bbox(bbox)
+    geom_json, lat, lon = _geometry_fields(geom)
 
     confidence = "A_exact" if geom is not None else "U_unknown"
     rationale = "CAP polygon geometry" if geom is not None else "CAP without geometry"
@@ -840,13 +1005,11 @@ def normalize_tsunami_cap(*, source_id: str, record: dict, fetched_at: str) -> d
         confidence = "C_source_default"
         rationale = "PTWC CAP default region centroid"
 
-    summary = description.strip()
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(description.strip())
 
     normalized_title = normalize_title(headline)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{headline} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {
         "status": record.get("status"),
@@ -855,11 +1018,11 @@ def normalize_tsunami_cap(*, source_id: str, record: dict, fetched_at: str) -> d
     }
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "xml_api",
         "external_id": identifier,
-        "url": canonicalize_url(f"tsunami:{identifier}"),
+        "url": _synthetic_url("tsunami", identifier),
         "title": headline,
         "summary": summary,
         "content": None,
@@ -867,16 +1030,16 @@ def normalize_tsunami_cap(*, source_id: str, record: dict, fetched_at: str) -> d
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "tsunami",
-        "tags": json.dumps(["tsunami"], ensure_ascii=False),
+        "tags": _TSUNAMI_TAGS_JSON,
         "geom_geojson": geom_json,
         "lat": lat,
         "lon": lon,
         "location_name": area_desc,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -890,12 +1053,15 @@ def normalize_firms_hotspot(*, source_id: str, record: dict, fetched_at: str) ->
     published_at = fetched_at
     if acq_date and acq_time and len(acq_time) >= 3:
         try:
-            hh = int(acq_time.zfill(4)[:2])
-            mm = int(acq_time.zfill(4)[2:4])
+            if len(acq_time) <= 4 and acq_time.isdigit():
+                hh, mm = divmod(int(acq_time), 100)
+            else:
+                hh = int(acq_time.zfill(4)[:2])
+                mm = int(acq_time.zfill(4)[2:4])
             dt = datetime.fromisoformat(acq_date).replace(
-                tzinfo=UTC, hour=hh, minute=mm, second=0, microsecond=0
+                tzinfo=None, hour=hh, minute=mm, second=0, microsecond=0
             )
-            published_at = dt.isoformat().replace("+00:00", "Z")
+            published_at = _iso_z(dt)
         except ValueError:
             published_at = fetched_at
 
@@ -912,15 +1078,15 @@ def normalize_firms_hotspot(*, source_id: str, record: dict, fetched_at: str) ->
     summary = ", ".join(summary_parts) or "NASA FIRMS hotspot"
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "csv_api",
         "external_id": external_id,
-        "url": canonicalize_url(f"firms:{external_id}"),
+        "url": _synthetic_url("firms", external_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -928,20 +1094,23 @@ def normalize_firms_hotspot(*, source_id: str, record: dict, fetched_at: str) ->
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "wildfire",
-        "tags": json.dumps(["firms", "wildfire"], ensure_ascii=False),
+        "tags": _FIRMS_TAGS_JSON,
         "geom_geojson": None,
         "lat": lat,
         "lon": lon,
         "location_name": None,
         "location_confidence": "A_exact",
         "location_rationale": "FIRMS hotspot lat/lon",
-        "raw": json.dumps(record, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(record),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
 
+_AVG_DELAY_DIGITS_RE = re.compile(r"(\d+)")
+
+
 def normalize_faa_airport_disruption(
     *,
     source_id: str,
@@ -964,10 +1133,8 @@ def normalize_faa_airport_disruption(
     update_time = record.get("update_time")
     if update_time:
         try:
-            dt = datetime.strptime(
-                str(update_time), "%a %b %d %H:%M:%S %Y UTC"
-            ).replace(tzinfo=UTC)
-            published_at = dt.isoformat().replace("+00:00", "Z")
+            dt = datetime.strptime(str(update_time), "%a %b %d %H:%M:%S %Y UTC")
+            published_at = _iso_z(dt)
         except ValueError:
             published_at = fetched_at
 
@@ -975,9 +1142,9 @@ def normalize_faa_airport_disruption(
     lon = None
     confidence = "U_unknown"
     rationale = "Airport not found in offline dataset"
-    if iata and iata in airports_by_iata:
-        lat, lon, name_out = airports_by_iata[iata]
-        name = name_out
+    airport = airports_by_iata.get(iata) if iata else None
+    if airport is not None:
+        lat, lon, name = airport
         confidence = "A_exact"
         rationale = "Offline airport dataset (IATA)"
 
@@ -992,13 +1159,13 @@ def normalize_faa_airport_disruption(
 
     avg_delay_min = None
     if record.get("avg_delay"):
-        m = re.search(r"(\\d+)", str(record["avg_delay"]))
+        m = _AVG_DELAY_DIGITS_RE.search(str(record["avg_delay"]))
         if m:
             avg_delay_min = int(m.group(1))
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {
         "reason": reason or None,
@@ -1010,11 +1177,11 @@ def normalize_faa_airport_disruption(
     }
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "xml_api",
         "external_id": f"{iata}:{published_at}",
-        "url": canonicalize_url(f"faa:{iata}:{published_at}"),
+        "url": _synthetic_url("faa", f"{iata}:{published_at}"),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1022,16 +1189,16 @@ def normalize_faa_airport_disruption(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "aviation_disruption",
-        "tags": json.dumps(["faa", "aviation_disruption"], ensure_ascii=False),
+        "tags": _FAA_TAGS_JSON,
         "geom_geojson": None,
         "lat": lat,
         "lon": lon,
         "location_name": name or None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1040,7 +1207,7 @@ def normalize_country_level_rss(
     *, source_id: str, record: dict, fetched_at: str, category: str, tags: list[str]
 ) -> dict:
     title = str(record.get("title") or "")
-    url = canonicalize_url(str(record.get("link") or ""))
+    url = _canonical_url(str(record.get("link") or ""))
     external_id = str(record.get("id") or url)
     summary = str(record.get("summary") or "")
     published_at = str(record.get("published") or fetched_at)
@@ -1053,15 +1220,15 @@ def normalize_country_level_rss(
             country = candidate
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "rss",
         "external_id": external_id,
-        "url": url if url else canonicalize_url(f"{source_id}:{external_id}"),
+        "url": url if url else _canonical_url(f"{source_id}:{external_id}"),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1069,7 +1236,7 @@ def normalize_country_level_rss(
         "updated_at": str(updated_at) if updated_at else None,
         "fetched_at": fetched_at,
         "category": category,
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
@@ -1078,9 +1245,9 @@ def normalize_country_level_rss(
         "location_rationale": "Country inferred from title"
         if country
         else "No country detected",
-        "raw": json.dumps({"feed_id": record.get("id")}, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps({"feed_id": record.get("id")}),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1095,7 +1262,7 @@ def normalize_nvd_cve(*, source_id: str, record: dict, fetched_at: str) -> dict:
             description = str(desc.get("value") or "")
             break
 
-    vendor_product: list[str] = []
+    seen_vendor_product: dict[str, None] = {}
     configurations = cve.get("configurations") or {}
     nodes = list(configurations.get("nodes") or [])
     while nodes:
@@ -1105,27 +1272,24 @@ def normalize_nvd_cve(*, source_id: str, record: dict, fetched_at: str) -> dict:
             criteria = str(match.get("criteria") or "")
             if not criteria.startswith("cpe:2.3:"):
                 continue
-            parts = criteria.split(":")
+            parts = criteria.split(":", 5)
             if len(parts) >= 5:
                 vendor = parts[3]
                 product = parts[4]
                 if vendor and product:
-                    vp = f"{vendor}:{product}"
-                    if vp not in vendor_product:
-                        vendor_product.append(vp)
+                    seen_vendor_product[f"{vendor}:{product}"] = None
+    vendor_product = list(seen_vendor_product)
 
     vp_summary = ", ".join(vendor_product[:3])
     title = f"{cve_id} - {vp_summary}" if vp_summary else cve_id
-    summary = description.strip()
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(description.strip())
 
     published_at = str(cve.get("published") or fetched_at)
     updated_at = str(cve.get("lastModified") or "") or None
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     raw = {
         "cve": cve_id,
@@ -1136,11 +1300,11 @@ def normalize_nvd_cve(*, source_id: str, record: dict, fetched_at: str) -> dict:
     tags = ["nvd", "cve"] + vendor_product[:5]
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": cve_id,
-        "url": canonicalize_url(f"https://nvd.nist.gov/vuln/detail/{cve_id}"),
+        "url": _canonical_url(f"https://nvd.nist.gov/vuln/detail/{cve_id}"),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1148,16 +1312,16 @@ def normalize_nvd_cve(*, source_id: str, record: dict, fetched_at: str) -> dict:
         "updated_at": updated_at,
         "fetched_at": fetched_at,
         "category": "cyber_cve",
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": None,
         "location_confidence": "U_unknown",
         "location_rationale": "Cyber advisory (non-geographic)",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1168,24 +1332,22 @@ def normalize_cisa_kev(*, source_id: str, record: dict, fetched_at: str) -> dict
     product = str(record.get("product") or "")
 
     title = f"KEV: {cve_id} - {vendor} {product}".strip()
-    summary = str(
-        record.get("vulnerabilityName") or record.get("shortDescription") or ""
+    summary = _clip(
+        str(record.get("vulnerabilityName") or record.get("shortDescription") or "")
     )
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
 
     published_at = str(record.get("dateAdded") or fetched_at)
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": cve_id,
-        "url": canonicalize_url(f"cisa-kev:{cve_id}"),
+        "url": _synthetic_url("cisa-kev", cve_id),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1193,16 +1355,16 @@ def normalize_cisa_kev(*, source_id: str, record: dict, fetched_at: str) -> dict
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "cyber_kev",
-        "tags": json.dumps(["cisa", "kev", vendor, product], ensure_ascii=False),
+        "tags": _constant_tags_json("cisa", "kev", vendor, product),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": None,
         "location_confidence": "U_unknown",
         "location_rationale": "Cyber advisory (non-geographic)",
-        "raw": json.dumps(record, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(record),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1215,9 +1377,7 @@ def normalize_govuk_travel_advice(
     external_id = str(record.get("content_id") or record.get("base_path") or title)
 
     details = record.get("details") or {}
-    change = str(details.get("change_description") or "")
-    if len(change) > 300:
-        change = change[:297] + "..."
+    change = _clip(str(details.get("change_description") or ""))
 
     country = details.get("country") or {}
     country_name = str(country.get("name") or "") or None
@@ -1225,17 +1385,15 @@ def normalize_govuk_travel_advice(
     published_at = str(record.get("public_updated_at") or fetched_at)
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{change}".strip()
-    sim = simhash64(f"{title} {change[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, change)
+    sim = _item_simhash(normalized_title, change)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": external_id,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"govuk:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("govuk", external_id),
         "title": title,
         "summary": change,
         "content": None,
@@ -1243,7 +1401,7 @@ def normalize_govuk_travel_advice(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "travel_advisory",
-        "tags": json.dumps(["govuk", "travel_advisory"], ensure_ascii=False),
+        "tags": _GOVUK_TAGS_JSON,
         "geom_geojson": None,
         "lat": None,
         "lon": None,
@@ -1252,9 +1410,9 @@ def normalize_govuk_travel_advice(
         "location_rationale": "GOV.UK is country-level"
         if country_name
         else "No country detected",
-        "raw": json.dumps(record, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(record),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1266,9 +1424,7 @@ def normalize_reliefweb_report(
     fields = record.get("fields") or {}
 
     title = str(fields.get("title") or "")
-    summary = str(fields.get("headline") or fields.get("body") or "")
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(str(fields.get("headline") or fields.get("body") or ""))
 
     published_at = fetched_at
     dates = fields.get("date")
@@ -1286,15 +1442,15 @@ def normalize_reliefweb_report(
             country = str(first["name"])
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": report_id,
-        "url": canonicalize_url(f"reliefweb:report:{report_id}"),
+        "url": _synthetic_url("reliefweb", f"report:{report_id}"),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1302,7 +1458,7 @@ def normalize_reliefweb_report(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "disaster",
-        "tags": json.dumps(["reliefweb", "report"], ensure_ascii=False),
+        "tags": _RELIEFWEB_REPORT_TAGS_JSON,
         "geom_geojson": None,
         "lat": None,
         "lon": None,
@@ -1311,9 +1467,9 @@ def normalize_reliefweb_report(
         "location_rationale": "ReliefWeb report country"
         if country
         else "No country detected",
-        "raw": json.dumps(record, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(record),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1325,9 +1481,7 @@ def normalize_reliefweb_disaster(
     fields = record.get("fields") or {}
 
     title = str(fields.get("name") or fields.get("title") or "")
-    summary = str(fields.get("description") or "")
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(str(fields.get("description") or ""))
 
     published_at = fetched_at
     dates = fields.get("date")
@@ -1342,15 +1496,15 @@ def normalize_reliefweb_disaster(
             country = str(first["name"])
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": disaster_id,
-        "url": canonicalize_url(f"reliefweb:disaster:{disaster_id}"),
+        "url": _synthetic_url("reliefweb", f"disaster:{disaster_id}"),
         "title": title,
         "summary": summary,
         "content": None,
@@ -1358,7 +1512,7 @@ def normalize_reliefweb_disaster(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "disaster",
-        "tags": json.dumps(["reliefweb", "disaster"], ensure_ascii=False),
+        "tags": _RELIEFWEB_DISASTER_TAGS_JSON,
         "geom_geojson": None,
         "lat": None,
         "lon": None,
@@ -1367,9 +1521,9 @@ def normalize_reliefweb_disaster(
         "location_rationale": "ReliefWeb disaster country"
         if country
         else "No country detected",
-        "raw": json.dumps(record, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(record),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1385,16 +1539,14 @@ def normalize_msi_broadcast_warning(
     published_at = fetched_at
     if issue_date:
         try:
-            dt = datetime.strptime(issue_date, "%d%H%MZ %b %Y").replace(tzinfo=UTC)
-            published_at = dt.isoformat().replace("+00:00", "Z")
+            dt = _parse_msi_issue_date(issue_date)
+            published_at = _iso_z(dt)
         except ValueError:
             published_at = fetched_at
 
     text = str(record.get("text") or "").strip()
     title = f"NAVAREA {nav_area} {msg_number}/{msg_year}".strip()
-    summary = text.replace("\n", " ").strip()
-    if len(summary) > 300:
-        summary = summary[:297] + "..."
+    summary = _clip(text.replace("\n", " ").strip())
 
     coords = extract_coords_centroid(text)
     lat = coords[0] if coords is not None else None
@@ -1432,16 +1584,16 @@ def normalize_msi_broadcast_warning(
         raw["is_hazard"] = True
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
-    url = canonicalize_url(
+    url = _canonical_url(
         f"https://msi.pub.kubic.nga.mil/api/publications/broadcast-warn?output=json&navArea={nav_area}&msgNumber={msg_number}&msgYear={msg_year}"
     )
     external_id = f"{nav_area}-{msg_number}-{msg_year}".strip("-")
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "json_api",
         "external_id": external_id,
@@ -1453,22 +1605,21 @@ def normalize_msi_broadcast_warning(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "maritime_warning",
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": None,
         "lat": lat,
         "lon": lon,
         "location_name": f"NAVAREA {nav_area}".strip() if nav_area else None,
         "location_confidence": confidence,
         "location_rationale": rationale,
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
 
 _HTML_TAG_RE = re.compile(r"<[^>]+>", flags=re.UNICODE)
-_WS_RE = re.compile(r"\s+", flags=re.UNICODE)
 
 
 def normalize_mastodon_status(
@@ -1479,8 +1630,7 @@ def normalize_mastodon_status(
     external_id = str(record.get("id") or url)
 
     content_html = str(record.get("content") or "")
-    text = html.unescape(_HTML_TAG_RE.sub(" ", content_html))
-    text = _WS_RE.sub(" ", text).strip()
+    text = " ".join(html.unescape(_HTML_TAG_RE.sub(" ", content_html)).split())
 
     spoiler = str(record.get("spoiler_text") or "").strip()
     title = spoiler or text[:140] or f"Mastodon post on {instance}"
@@ -1504,17 +1654,15 @@ def normalize_mastodon_status(
         tags.append(f"acct:{acct}")
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "social",
         "external_id": external_id,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"mastodon:{external_id}"),
+        "url": _canonical_url(url) if url else _synthetic_url("mastodon", external_id),
         "title": title,
         "summary": summary,
         "content": text or None,
@@ -1522,16 +1670,16 @@ def normalize_mastodon_status(
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "social",
-        "tags": json.dumps(tags, ensure_ascii=False),
+        "tags": _tags_json(tags),
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": None,
         "location_confidence": "U_unknown",
         "location_rationale": "Mastodon post without structured geo",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
 
@@ -1560,17 +1708,15 @@ def normalize_bluesky_post(*, source_id: str, record: dict, fetched_at: str) ->
     raw = {"uri": uri, "cid": cid, "handle": handle or None}
 
     normalized_title = normalize_title(title)
-    content_for_hash = f"{normalized_title}\n{summary}".strip()
-    sim = simhash64(f"{title} {summary[:280]}")
+    hash_title, hash_content = _dual_hash(normalized_title, summary)
+    sim = _item_simhash(normalized_title, summary)
 
     return {
-        "item_id": str(uuid.uuid4()),
+        "item_id": _UUID_POOL.next(),
         "source_id": source_id,
         "source_type": "social",
         "external_id": uri or cid or url,
-        "url": canonicalize_url(url)
-        if url
-        else canonicalize_url(f"bluesky:{uri or cid}"),
+        "url": _canonical_url(url) if url else _synthetic_url("bluesky", uri or cid),
         "title": title,
         "summary": summary,
         "content": text or None,
@@ -1578,15 +1724,15 @@ def normalize_bluesky_post(*, source_id: str, record: dict, fetched_at: str) ->
         "updated_at": None,
         "fetched_at": fetched_at,
         "category": "social",
-        "tags": json.dumps(["bluesky", "social"], ensure_ascii=False),
+        "tags": _BLUESKY_TAGS_JSON,
         "geom_geojson": None,
         "lat": None,
         "lon": None,
         "location_name": None,
         "location_confidence": "U_unknown",
         "location_rationale": "Bluesky post without structured geo",
-        "raw": json.dumps(raw, ensure_ascii=False),
-        "hash_title": _sha256_hex(normalized_title),
-        "hash_content": _sha256_hex(content_for_hash),
+        "raw": _json_dumps(raw),
+        "hash_title": hash_title,
+        "hash_content": hash_content,
         "simhash": _u64_to_i64(sim),
     }
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from collections import deque
 from dataclasses import dataclass
+from functools import cached_property
+
+_encode_event_data = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
 
 
 @dataclass(frozen=True)
@@ -9,28 +14,44 @@ class Event:
     type: str
     data: dict
 
+    @cached_property
+    def encoded_data(self) -> str:
+        return _encode_event_data(self.data)
+
+
+class Subscription:
+    def __init__(self, maxlen: int = 200) -> None:
+        self._events: deque[Event] = deque(maxlen=maxlen)
+        self._ready = asyncio.Event()
+
+    def push(self, event: Event) -> None:
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self) -> Event:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
 
 class EventBus:
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
-        self._subscribers: set[asyncio.Queue[Event]] = set()
+        self._subscribers: tuple[Subscription, ...] = ()
 
-    async def subscribe(self) -> asyncio.Queue[Event]:
-        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=200)
+    async def subscribe(self) -> Subscription:
+        subscription = Subscription()
         async with self._lock:
-            self._subscribers.add(queue)
-        return queue
+            self._subscribers = (*self._subscribers, subscription)
+        return subscription
 
-    async def unsubscribe(self, queue: asyncio.Queue[Event]) -> None:
+    async def unsubscribe(self, subscription: Subscription) -> None:
         async with self._lock:
-            self._subscribers.discard(queue)
+            self._subscribers = tuple(
+                s for s in self._subscribers if s is not subscription
+            )
 
     async def publish(self, event: Event) -> None:
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                _ = queue.get_nowait()
-                queue.put_nowait(event)
+        for subscription in self._subscribers:
+            subscription.push(event)
@@ -16,7 +16,7 @@ router = APIRouter()
 @router.get("/sse")
 async def sse(request: Request) -> StreamingResponse:
     bus: EventBus = request.app.state.bus
-    queue = await bus.subscribe()
+    subscription = await bus.subscribe()
 
     async def event_stream():
         try:
@@ -25,16 +25,15 @@ async def sse(request: Request) -> StreamingResponse:
                 if await request.is_disconnected():
                     return
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                    event = await asyncio.wait_for(subscription.get(), timeout=15)
                 except asyncio.TimeoutError:
                     ts = datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
                     yield f"event: heartbeat\ndata: {json.dumps({'ts': ts})}\n\n"
                     continue
 
-                data = json.dumps(event.data, separators=(",", ":"), ensure_ascii=False)
-                yield f"event: {event.type}\ndata: {data}\n\n"
+                yield f"event: {event.type}\ndata: {event.encoded_data}\n\n"
         finally:
-            await bus.unsubscribe(queue)
+            await bus.unsubscribe(subscription)
 
     return StreamingResponse(
         event_stream(),
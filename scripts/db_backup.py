@@ -22,9 +22,11 @@ def main() -> None:
     )
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    src = sqlite3.connect(db_path)
+    src = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
     dst = sqlite3.connect(out_path)
     try:
+        dst.execute("PRAGMA journal_mode=OFF;")
+        dst.execute("PRAGMA synchronous=OFF;")
         src.backup(dst)
     finally:
         dst.close()
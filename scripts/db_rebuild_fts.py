@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from app.settings import Settings
+from store.db import close_database, open_database, rebuild_fts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", type=Path, default=None)
+    args = parser.parse_args()
+
+    settings = Settings()
+    db_path = args.db or settings.db_path
+
+    db = open_database(db_path, readers=0)
+    try:
+        rebuild_fts(db)
+    finally:
+        close_database(db)
+
+    print(db_path)
+
+
+if __name__ == "__main__":
+    main()
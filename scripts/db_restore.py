@@ -17,7 +17,7 @@ def main() -> None:
     db_path = args.db or settings.db_path
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    src = sqlite3.connect(args.backup)
+    src = sqlite3.connect(f"{args.backup.resolve().as_uri()}?mode=ro", uri=True)
     dst = sqlite3.connect(db_path)
     try:
         src.backup(dst)
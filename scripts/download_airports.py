@@ -12,10 +12,18 @@ def main() -> None:
     dest = Path(__file__).resolve().parents[1] / "geo" / "data" / "airports.csv"
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        res = client.get(URL, headers={"User-Agent": "situation-monitor/0.1"})
+    tmp = dest.with_suffix(".csv.part")
+    with (
+        httpx.Client(timeout=30.0, follow_redirects=True) as client,
+        client.stream(
+            "GET", URL, headers={"User-Agent": "situation-monitor/0.1"}
+        ) as res,
+    ):
         res.raise_for_status()
-        dest.write_bytes(res.content)
+        with tmp.open("wb") as f:
+            for chunk in res.iter_bytes(65536):
+                f.write(chunk)
+    tmp.replace(dest)
 
 
 if __name__ == "__main__":
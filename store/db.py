@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
+import queue
 import sqlite3
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,6 +14,7 @@ from pathlib import Path
 class Database:
     conn: sqlite3.Connection
     lock: threading.Lock
+    readers: queue.Queue[sqlite3.Connection]
 
 
 _MIGRATIONS: list[tuple[int, str]] = [
@@ -217,33 +222,180 @@ _MIGRATIONS: list[tuple[int, str]] = [
           ON places(kind, normalized_name, country_code, admin1);
         """,
     ),
+    (
+        6,
+        """
+        CREATE INDEX IF NOT EXISTS items_source_hash_title_published_idx
+          ON items(source_id, hash_title, published_at);
+        """,
+    ),
+    (
+        7,
+        """
+        DROP TRIGGER IF EXISTS items_fts_au;
+        CREATE TRIGGER items_fts_au AFTER UPDATE OF title, summary, content ON items
+        WHEN old.title IS NOT new.title
+          OR old.summary IS NOT new.summary
+          OR old.content IS NOT new.content
+        BEGIN
+          INSERT INTO items_fts(items_fts, rowid, title, summary, content)
+          VALUES('delete', old.rowid, old.title, old.summary, old.content);
+          INSERT INTO items_fts(rowid, title, summary, content)
+          VALUES (new.rowid, new.title, new.summary, new.content);
+        END;
+
+        DROP TRIGGER IF EXISTS incidents_fts_au;
+        CREATE TRIGGER incidents_fts_au AFTER UPDATE OF title, summary ON incidents
+        WHEN old.title IS NOT new.title OR old.summary IS NOT new.summary
+        BEGIN
+          INSERT INTO incidents_fts(incidents_fts, rowid, title, summary)
+          VALUES('delete', old.rowid, old.title, old.summary);
+          INSERT INTO incidents_fts(rowid, title, summary)
+          VALUES (new.rowid, new.title, new.summary);
+        END;
+        """,
+    ),
+    (
+        8,
+        """
+        CREATE INDEX IF NOT EXISTS items_cat_pub_idx ON items(category, published_at DESC);
+        CREATE INDEX IF NOT EXISTS items_hash_title_pub_idx ON items(hash_title, published_at);
+        CREATE INDEX IF NOT EXISTS incidents_cat_last_seen_idx
+          ON incidents(category, last_seen_at DESC);
+
+        DROP INDEX IF EXISTS items_category_idx;
+        DROP INDEX IF EXISTS items_hash_title_idx;
+        DROP INDEX IF EXISTS incidents_category_idx;
+
+        ANALYZE;
+        """,
+    ),
+    (
+        9,
+        """
+        DROP TRIGGER IF EXISTS items_fts_ai;
+        """,
+    ),
 ]
 
+_SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+_U64_MASK = (1 << 64) - 1
+
+
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA foreign_keys=ON;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+def hamming_distance_i64(a: int, b: int) -> int:
+    return ((a ^ b) & _U64_MASK).bit_count()
+
+
+def _register_functions(conn: sqlite3.Connection) -> None:
+    conn.create_function(
+        "hamming_distance", 2, hamming_distance_i64, deterministic=True
+    )
+
 
-def open_database(path: Path) -> Database:
+def open_database(path: Path, *, readers: int = 4) -> Database:
     path.parent.mkdir(parents=True, exist_ok=True)
+    fresh = not path.exists() or path.stat().st_size == 0
     conn = sqlite3.connect(path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA synchronous=NORMAL;")
-    conn.execute("PRAGMA foreign_keys=ON;")
-    conn.execute("PRAGMA busy_timeout=5000;")
+    _register_functions(conn)
+    if fresh:
+        conn.execute("PRAGMA page_size=8192;")
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA journal_size_limit=67108864;
+        PRAGMA wal_autocheckpoint=1000;
+        """
+        + _CONNECTION_PRAGMAS
+    )
     _apply_migrations(conn)
-    return Database(conn=conn, lock=threading.Lock())
+
+    pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+    uri = f"{path.resolve().as_uri()}?mode=ro"
+    for _ in range(readers):
+        reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        reader.row_factory = sqlite3.Row
+        _register_functions(reader)
+        reader.executescript(_CONNECTION_PRAGMAS + "PRAGMA query_only=ON;")
+        pool.put(reader)
+    return Database(conn=conn, lock=threading.Lock(), readers=pool)
+
+
+@contextmanager
+def read_connection(db: Database) -> Iterator[sqlite3.Connection]:
+    conn = db.readers.get()
+    try:
+        yield conn
+    finally:
+        db.readers.put(conn)
+
+
+def index_items_fts(db: Database, rowids: list[int]) -> None:
+    if not rowids:
+        return
+    db.conn.execute(
+        """
+        INSERT INTO items_fts(rowid, title, summary, content)
+        SELECT rowid, title, summary, content
+        FROM items
+        WHERE rowid IN (SELECT value FROM json_each(?));
+        """,
+        (json.dumps(rowids),),
+    )
+
+
+def rebuild_fts(db: Database) -> None:
+    with db.lock:
+        db.conn.executescript(
+            """
+            INSERT INTO items_fts(items_fts) VALUES('rebuild');
+            INSERT INTO incidents_fts(incidents_fts) VALUES('rebuild');
+            """
+        )
+
+
+def close_database(db: Database) -> None:
+    with db.lock:
+        db.conn.close()
+    while not db.readers.empty():
+        db.readers.get_nowait().close()
 
 
 def _apply_migrations(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER NOT NULL PRIMARY KEY);"
-    )
-    row = conn.execute(
-        "SELECT COALESCE(MAX(version), 0) AS v FROM schema_migrations;"
-    ).fetchone()
-    current_version = int(row["v"])
-
-    for version, sql in _MIGRATIONS:
-        if version <= current_version:
-            continue
-        conn.executescript(sql)
-        conn.execute("INSERT INTO schema_migrations(version) VALUES (?);", (version,))
-        conn.commit()
+    current_version = int(conn.execute("PRAGMA user_version;").fetchone()[0])
+    if current_version >= _SCHEMA_VERSION:
+        return
+    if current_version == 0:
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations';"
+        ).fetchone()
+        if legacy is not None:
+            row = conn.execute(
+                "SELECT COALESCE(MAX(version), 0) AS v FROM schema_migrations;"
+            ).fetchone()
+            current_version = int(row["v"])
+
+    pending = [
+        f"{sql}\nPRAGMA user_version = {version};\n"
+        for version, sql in _MIGRATIONS
+        if version > current_version
+    ]
+    if not pending:
+        return
+    try:
+        conn.executescript("BEGIN IMMEDIATE;\n" + "".join(pending) + "COMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
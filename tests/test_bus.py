@@ -0,0 +1,18 @@
+import asyncio
+
+from realtime.bus import Event, EventBus
+
+
+def test_slow_subscriber_receives_newest_events_in_order() -> None:
+    async def scenario() -> list[int]:
+        bus = EventBus()
+        subscription = await bus.subscribe()
+        for seq in range(250):
+            await bus.publish(Event(type="incident.updated", data={"seq": seq}))
+        received = [(await subscription.get()).data["seq"] for _ in range(200)]
+        await bus.publish(Event(type="incident.updated", data={"seq": 250}))
+        received.append((await subscription.get()).data["seq"])
+        await bus.unsubscribe(subscription)
+        return received
+
+    assert asyncio.run(scenario()) == [*range(50, 251)]
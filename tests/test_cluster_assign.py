@@ -0,0 +1,75 @@
+from datetime import UTC, datetime, timedelta
+
+from cluster.clusterer import assign_item_to_incident
+from ingest.scheduler import WriteJob, _write_items
+from normalize.normalize import normalize_generic_rss
+from store.db import close_database, open_database
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _seed_incident(db, incident_id: str, simhash: int, last_seen_at: str) -> None:
+    db.conn.execute(
+        """
+        INSERT INTO incidents(
+          incident_id, title, summary, category, first_seen_at, last_seen_at, last_item_at,
+          status, severity_score, location_confidence, location_rationale,
+          incident_simhash, item_count, source_count
+        )
+        VALUES(?, ?, '', 'earthquake', ?, ?, ?, 'active', 10, 'U_unknown', '', ?, 0, 0);
+        """,
+        (incident_id, incident_id, last_seen_at, last_seen_at, last_seen_at, simhash),
+    )
+
+
+def _write_item(db) -> tuple[str, int]:
+    db.conn.execute(
+        """
+        INSERT INTO sources(source_id, name, source_type, url, poll_interval_seconds)
+        VALUES('feed', 'feed', 'rss', 'https://example.com/feed', 300);
+        """
+    )
+    item = normalize_generic_rss(
+        source_id="feed",
+        record={
+            "title": "Strong quake shakes coastal towns",
+            "link": "https://e.com/q",
+        },
+        fetched_at=_iso(datetime.now(tz=UTC)),
+        category="earthquake",
+    )
+    [item_id] = _write_items(db, WriteJob(source_id="feed", items=[item], cursor=None))
+    return item_id, int(item["simhash"])
+
+
+def test_assign_item_joins_nearest_incident(tmp_path) -> None:
+    db = open_database(tmp_path / "test.db")
+    try:
+        item_id, simhash = _write_item(db)
+        now = datetime.now(tz=UTC)
+        _seed_incident(db, "near", simhash ^ 0b11, _iso(now - timedelta(hours=2)))
+        _seed_incident(db, "far", simhash ^ 0b11111, _iso(now - timedelta(hours=1)))
+        _seed_incident(db, "too_far", simhash ^ 0xFFFF, _iso(now))
+        db.conn.commit()
+
+        result = assign_item_to_incident(db, item_id)
+        assert result.incident_id == "near"
+        assert result.event_type == "incident.updated"
+    finally:
+        close_database(db)
+
+
+def test_assign_item_breaks_distance_ties_by_last_seen(tmp_path) -> None:
+    db = open_database(tmp_path / "test.db")
+    try:
+        item_id, simhash = _write_item(db)
+        now = datetime.now(tz=UTC)
+        _seed_incident(db, "older", simhash ^ 0b11, _iso(now - timedelta(hours=3)))
+        _seed_incident(db, "newer", simhash ^ 0b1100, _iso(now - timedelta(hours=1)))
+        db.conn.commit()
+
+        assert assign_item_to_incident(db, item_id).incident_id == "newer"
+    finally:
+        close_database(db)
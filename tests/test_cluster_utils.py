@@ -1,4 +1,9 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from cluster.clusterer import (
+    _PLAIN_QUERY_RE,
+    _TRACKING_PARAM_NAMES,
+    _u64_to_i64,
     canonicalize_url,
     hamming_distance,
     normalize_title,
@@ -15,9 +20,78 @@ def test_canonicalize_url_strips_tracking() -> None:
     assert canonicalize_url(url) == "https://example.com/path?a=1"
 
 
+def _canonicalize_url_slow(url: str) -> str:
+    parts = urlsplit(url)
+    kept_params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.casefold().startswith("utm_")
+        and key.casefold() not in _TRACKING_PARAM_NAMES
+    ]
+    return urlunsplit(
+        (
+            parts.scheme,
+            parts.netloc.casefold(),
+            parts.path,
+            urlencode(kept_params, doseq=True),
+            "",
+        )
+    )
+
+
+def test_canonicalize_url_fast_path_matches_slow_path() -> None:
+    cases = {
+        "https://Example.com/a?id=7&UTM_Medium=rss&gclid=z": (
+            True,
+            "https://example.com/a?id=7",
+        ),
+        "https://example.com/a?utm_source=x&fbclid=y": (True, "https://example.com/a"),
+        "https://example.com/a?a=&b=1&c=": (True, "https://example.com/a?a=&b=1&c="),
+        "https://example.com/a?v=1.2_x~y-z": (
+            True,
+            "https://example.com/a?v=1.2_x~y-z",
+        ),
+        "https://example.com/a": (True, "https://example.com/a"),
+        "https://example.com/a?q=caf%C3%A9&utm_source=x": (
+            False,
+            "https://example.com/a?q=caf%C3%A9",
+        ),
+        "https://example.com/a?q=a%20b": (False, "https://example.com/a?q=a+b"),
+        "https://example.com/a?q=a+b&fbclid=y": (False, "https://example.com/a?q=a+b"),
+        "https://example.com/a?flag&b=1": (False, "https://example.com/a?flag=&b=1"),
+    }
+    for url, (fast, expected) in cases.items():
+        assert bool(_PLAIN_QUERY_RE.fullmatch(urlsplit(url).query)) is fast
+        assert canonicalize_url(url) == expected
+        assert canonicalize_url(url) == _canonicalize_url_slow(url)
+
+
 def test_simhash_distance_sanity() -> None:
     a = simhash64("earthquake near tokyo")
     b = simhash64("earthquake near tokyo japan")
     c = simhash64("sports results premier league")
     assert hamming_distance(a, b) <= 12
     assert hamming_distance(a, c) > 12
+
+
+def test_simhash64_pinned_values() -> None:
+    expected = {
+        "earthquake near tokyo": (8150479439691915437, 8150479439691915437),
+        "M 6.1 - 45 km SW of Hualien City, Taiwan": (
+            11848209293565232646,
+            -6598534780144318970,
+        ),
+        "Wildfire forces evacuations in northern California": (
+            16889070947869399594,
+            -1557673125840152022,
+        ),
+        "flood flood flood warning warning river": (
+            367188196707952284,
+            367188196707952284,
+        ),
+        "": (0, 0),
+    }
+    for title, (unsigned, signed) in expected.items():
+        value = simhash64(title)
+        assert value == unsigned
+        assert _u64_to_i64(value) == signed
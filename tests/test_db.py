@@ -0,0 +1,47 @@
+import sqlite3
+
+from store.db import _MIGRATIONS, close_database, open_database
+
+
+def test_legacy_schema_migrations_db_upgrades_to_user_version(tmp_path) -> None:
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    for version, sql in _MIGRATIONS[:6]:
+        conn.executescript(sql)
+        conn.execute("INSERT INTO schema_migrations(version) VALUES (?);", (version,))
+        conn.commit()
+    conn.close()
+
+    db = open_database(path)
+    try:
+        assert db.conn.execute("PRAGMA user_version;").fetchone()[0] == 9
+        objects = {
+            (str(r["type"]), str(r["name"])): str(r["sql"] or "")
+            for r in db.conn.execute("SELECT type, name, sql FROM sqlite_master;")
+        }
+        assert ("trigger", "items_fts_ai") not in objects
+        assert ("trigger", "items_fts_ad") in objects
+        assert (
+            "AFTER UPDATE OF title, summary, content"
+            in objects[("trigger", "items_fts_au")]
+        )
+        assert (
+            "AFTER UPDATE OF title, summary" in objects[("trigger", "incidents_fts_au")]
+        )
+        for index in (
+            "items_cat_pub_idx",
+            "items_hash_title_pub_idx",
+            "incidents_cat_last_seen_idx",
+            "items_source_hash_title_published_idx",
+        ):
+            assert ("index", index) in objects
+        assert ("index", "items_category_idx") not in objects
+        assert ("index", "items_hash_title_idx") not in objects
+    finally:
+        close_database(db)
+
+    db = open_database(path)
+    try:
+        assert db.conn.execute("PRAGMA user_version;").fetchone()[0] == 9
+    finally:
+        close_database(db)
@@ -1,5 +1,5 @@
 from geo.gazetteer import match_country_in_text, suggest_places
-from store.db import open_database
+from store.db import close_database, open_database
 
 
 def test_gazetteer_ambiguity_georgia(tmp_path) -> None:
@@ -11,8 +11,7 @@ def test_gazetteer_ambiguity_georgia(tmp_path) -> None:
         assert any(r["country_code"] == "GE" for r in results)
         assert any(r["country_code"] == "US" for r in results)
     finally:
-        with db.lock:
-            db.conn.close()
+        close_database(db)
 
 
 def test_match_country_in_text_word_boundaries() -> None:
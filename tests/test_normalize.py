@@ -0,0 +1,30 @@
+import json
+
+from normalize.normalize import (
+    normalize_faa_airport_disruption,
+    normalize_smartraveller_rss,
+)
+
+
+def test_smartraveller_rss_country_from_title() -> None:
+    item = normalize_smartraveller_rss(
+        source_id="smartraveller_do_not_travel",
+        record={
+            "title": "Guinea-Bissau - Reconsider your need to travel",
+            "link": "https://www.smartraveller.gov.au/destinations/africa/guinea-bissau",
+        },
+        fetched_at="2026-01-01T00:00:00Z",
+        advice_level="reconsider",
+    )
+    assert item["location_name"] == "Guinea-Bissau"
+    assert item["location_confidence"] == "C_country"
+
+
+def test_faa_avg_delay_minutes_parsed() -> None:
+    item = normalize_faa_airport_disruption(
+        source_id="faa_nas_status",
+        record={"iata": "SFO", "type": "Ground Delay", "avg_delay": "45 minutes"},
+        fetched_at="2026-01-01T00:00:00Z",
+        airports_by_iata={},
+    )
+    assert json.loads(item["raw"])["avg_delay_min"] == 45
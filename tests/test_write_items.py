@@ -0,0 +1,94 @@
+from datetime import UTC, datetime
+
+from ingest.scheduler import WriteJob, _write_items
+from normalize.normalize import normalize_generic_rss
+from store.db import close_database, open_database
+
+
+def _open_with_source(tmp_path, source_id: str):
+    db = open_database(tmp_path / "test.db")
+    db.conn.execute(
+        """
+        INSERT INTO sources(source_id, name, source_type, url, poll_interval_seconds)
+        VALUES(?, ?, 'rss', 'https://example.com/feed', 300);
+        """,
+        (source_id, source_id),
+    )
+    db.conn.commit()
+    return db
+
+
+def _rss_item(source_id: str, category: str, **record) -> dict:
+    fetched_at = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return normalize_generic_rss(
+        source_id=source_id, record=record, fetched_at=fetched_at, category=category
+    )
+
+
+def test_write_items_indexes_fts(tmp_path) -> None:
+    db = _open_with_source(tmp_path, "feed")
+    try:
+        items = [
+            _rss_item(
+                "feed",
+                "disaster",
+                title="Volcanic ash closes Kefrontia airport",
+                link="https://example.com/a",
+            ),
+            _rss_item(
+                "feed",
+                "disaster",
+                title="Flooding reported along the Marrowin river",
+                link="https://example.com/b",
+            ),
+        ]
+        inserted = _write_items(
+            db, WriteJob(source_id="feed", items=items, cursor=None)
+        )
+        assert len(inserted) == 2
+
+        for term, item in (("kefrontia", items[0]), ("marrowin", items[1])):
+            rows = db.conn.execute(
+                """
+                SELECT i.item_id
+                FROM items_fts
+                JOIN items i ON i.rowid = items_fts.rowid
+                WHERE items_fts MATCH ?;
+                """,
+                (term,),
+            ).fetchall()
+            assert [r["item_id"] for r in rows] == [item["item_id"]]
+    finally:
+        close_database(db)
+
+
+def test_write_items_dedupes_within_batch(tmp_path) -> None:
+    db = _open_with_source(tmp_path, "feed")
+    try:
+        news = [
+            _rss_item(
+                "feed", "news", id="guid-1", title="First", link="https://e.com/1"
+            ),
+            _rss_item(
+                "feed", "news", id="guid-1", title="Again", link="https://e.com/2"
+            ),
+        ]
+        titled = [
+            _rss_item("feed", "disaster", title="Same Title", link="https://e.com/3"),
+            _rss_item("feed", "disaster", title="same title!", link="https://e.com/4"),
+        ]
+        inserted = _write_items(
+            db, WriteJob(source_id="feed", items=news + titled, cursor=None)
+        )
+        assert inserted == [news[0]["item_id"], titled[0]["item_id"]]
+        assert db.conn.execute("SELECT COUNT(*) FROM items;").fetchone()[0] == 2
+
+        again = _rss_item(
+            "feed", "disaster", title="Same title", link="https://e.com/5"
+        )
+        assert (
+            _write_items(db, WriteJob(source_id="feed", items=[again], cursor=None))
+            == []
+        )
+    finally:
+        close_database(db)